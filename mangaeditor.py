@@ -2,21 +2,33 @@ import os
 import io
 import re
 import json
+import copy
+import secrets
 import sqlite3
 import threading
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+import queue
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 import math
+import time
+import itertools
 import shutil
 import base64
+import hashlib
+import functools
 import asyncio # Added for async operations
 import tempfile # Added for _number_images
+from concurrent.futures import ThreadPoolExecutor
 from PIL import Image, ImageDraw, ImageFont
+import numpy as np
 from pathlib import Path
 
 import requests
+from requests.adapters import HTTPAdapter
 import httpx
-from fastapi import APIRouter, HTTPException, Request, Body
+from fastapi import APIRouter, HTTPException, Request, Body, File, Form, UploadFile
 from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.templating import Jinja2Templates
 from PIL import Image
@@ -32,6 +44,16 @@ try:
 except ImportError:
     Groq = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyvips  # optional: region-decoding panel crops (needs the libvips system library)
+except (ImportError, OSError):
+    pyvips = None
+
 try:
     from openai import AzureOpenAI
 except ImportError as e:
@@ -63,6 +85,73 @@ router = APIRouter(prefix="/editor", tags=["manga-editor"])
 logger = logging.getLogger("mangaeditor")
 
 
+def _json_dumps(obj: Any) -> str:
+    """Serialize for TEXT columns; uses orjson when installed (much faster on large page lists)."""
+    if orjson is not None:
+        # OPT_NON_STR_KEYS keeps json.dumps' handling of int keys in metadata dicts
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj)
+
+
+def _json_loads(text: Any) -> Any:
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+_HTTP_PREFIXES = ("http://", "https://")
+_LOCAL_PREFIXES = ("/uploads/", "uploads/", "/manga_projects/", "manga_projects/")
+
+
+def _norm_page_path(p: Any) -> str:
+    """Normalize a page image reference for storage: URLs and served paths are kept
+    (made root-relative), anything else is taken as a bare filename under /uploads/."""
+    if not isinstance(p, str):
+        return ""
+    p = p.strip()
+    if not p or p.startswith(_HTTP_PREFIXES):
+        return p
+    if p.startswith(_LOCAL_PREFIXES):
+        return p if p[0] == "/" else "/" + p
+    return "/uploads/" + os.path.basename(p)
+
+
+def _new_id() -> str:
+    """Opaque random id for new projects, series and chapters.
+
+    Millisecond timestamps collided when several rows were created in the
+    same tick (batch chapter imports); 64 random bits do not.
+    """
+    return secrets.token_hex(8)
+
+
+def _dump(path: str, data: bytes) -> None:
+    """Write an in-memory blob to path with raw os.write calls (no BufferedWriter copy)."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+
+# Output directories already created by this process. Only for directories the app never
+# removes (project and TTS dirs); page dirs are rebuilt and must keep calling os.makedirs.
+_ENSURED_DIRS: set = set()
+
+
+def _ensure_dir(path: str) -> None:
+    if path not in _ENSURED_DIRS:
+        os.makedirs(path, exist_ok=True)
+        _ENSURED_DIRS.add(path)
+
+def _copy_to(src: Any, path: str) -> None:
+    """Stream a file object to path in 1 MB chunks (uploads and spooled responses never sit fully in memory)."""
+    with open(path, "wb") as dst:
+        shutil.copyfileobj(src, dst, 1 << 20)
+
 # --- Global Helper for Numbering Images ---
 def _number_images(paths: List[str]) -> List[str]:
     temp_paths = []
@@ -116,33 +205,276 @@ def _number_images(paths: List[str]) -> List[str]:
 
 
 # ---------------------------- SQLite helpers ----------------------------
+# Hot panel statements, shared by the single-row and bulk helpers so every call site hits
+# the same entry in the connection's prepared-statement cache (cached_statements=256)
+_SQL_SELECT_PAGE_PANELS = (
+    "SELECT panel_index, image_path, narration_text, audio_url, effect, transition, is_manual "
+    "FROM panels WHERE project_id=? AND page_number=? ORDER BY panel_index ASC"
+)
+_SQL_SELECT_PAGE_PANELS_LEGACY = (
+    "SELECT panel_index, image_path, narration_text, audio_url, effect, transition "
+    "FROM panels WHERE project_id=? AND page_number=? ORDER BY panel_index ASC"
+)
+_SQL_UPDATE_PANEL_NARRATION = (
+    "UPDATE panels SET narration_text=?, is_manual=?, updated_at=? "
+    "WHERE project_id=? AND page_number=? AND panel_index=?"
+)
+# A missing row is inserted with the image of the panel before it (as the per-row
+# writers did before these were upserts), so it is not dropped as an image-less panel.
+# Parameters: ?1 project_id, ?2 page_number, ?3 panel_index, ?4 now, then the values.
+_SQL_NEIGHBOUR_IMAGE = (
+    "COALESCE((SELECT image_path FROM panels WHERE project_id=?1 AND page_number=?2 AND panel_index=?3-1), '')"
+)
+_SQL_UPSERT_PANEL_AUDIO = (
+    "INSERT INTO panels(project_id, page_number, panel_index, image_path, narration_text, audio_url, created_at, updated_at) "
+    f"SELECT ?1, ?2, ?3, {_SQL_NEIGHBOUR_IMAGE}, '', ?5, ?4, ?4 WHERE true "
+    "ON CONFLICT(project_id, page_number, panel_index) DO UPDATE SET audio_url=excluded.audio_url, updated_at=excluded.updated_at"
+)
+_SQL_UPSERT_PANEL_CONFIG = (
+    "INSERT INTO panels(project_id, page_number, panel_index, image_path, narration_text, audio_url, created_at, updated_at, effect, transition) "
+    f"SELECT ?1, ?2, ?3, {_SQL_NEIGHBOUR_IMAGE}, '', NULL, ?4, ?4, ?5, ?6 WHERE true "
+    "ON CONFLICT(project_id, page_number, panel_index) DO UPDATE SET effect=excluded.effect, transition=excluded.transition, updated_at=excluded.updated_at"
+)
+_SQL_UPDATE_PANEL_CONFIG = (
+    "UPDATE panels SET effect=?, transition=?, updated_at=? "
+    "WHERE project_id=? AND page_number=? AND panel_index=?"
+)
+
+
+# Held by EditorDB.transaction() for a whole block and by every statement, commit and
+# rollback on the shared writer connection, so a write from another thread waits for
+# an open transaction instead of landing in (and being committed or rolled back with) it
+_WRITE_LOCK = threading.RLock()
+
+
+class _WriterCursor(sqlite3.Cursor):
+    def execute(self, *args: Any) -> "_WriterCursor":
+        with _WRITE_LOCK:
+            return super().execute(*args)
+
+    def executemany(self, *args: Any) -> "_WriterCursor":
+        with _WRITE_LOCK:
+            return super().executemany(*args)
+
+    def executescript(self, *args: Any) -> "_WriterCursor":
+        with _WRITE_LOCK:
+            return super().executescript(*args)
+
+
+class _WriterConnection(sqlite3.Connection):
+    """sqlite3 connection whose statements and commits run under _WRITE_LOCK."""
+
+    def cursor(self, factory: Any = _WriterCursor) -> sqlite3.Cursor:
+        return super().cursor(factory)
+
+    # Connection.execute* do not go through cursor(), so route them explicitly
+    def execute(self, *args: Any) -> sqlite3.Cursor:
+        return self.cursor().execute(*args)
+
+    def executemany(self, *args: Any) -> sqlite3.Cursor:
+        return self.cursor().executemany(*args)
+
+    def executescript(self, *args: Any) -> sqlite3.Cursor:
+        return self.cursor().executescript(*args)
+
+    def commit(self) -> None:
+        with _WRITE_LOCK:
+            super().commit()
+
+    def rollback(self) -> None:
+        with _WRITE_LOCK:
+            super().rollback()
+
+
 class EditorDB:
     _lock = threading.Lock()
+    _tx_lock = _WRITE_LOCK
+    _tx_local = threading.local()
     _conn: Optional[sqlite3.Connection] = None
+    _schema_ready = False
+    # Stored in PRAGMA user_version once init_schema has run its migrations. Databases
+    # already at this version skip the PRAGMA probes; bump it when adding a migration.
+    _SCHEMA_VERSION = 2
+    # Compatibility: pages_json is still written next to the pages table for older builds
+    # reading the same database; nothing in this module reads it any more.
+    _WRITE_PAGES_JSON = True
+    # Read-through cache for get_project/get_pages/get_panels_for_page/get_character_list. Entries are tagged with the
+    # connection's total_changes, so any write through EditorDB invalidates them; the TTL
+    # bounds staleness from writers outside this process.
+    _READ_CACHE_TTL = 30.0
+    _READ_CACHE_MAX = 1024
+    _read_cache: "OrderedDict[Tuple[Any, ...], Tuple[int, float, Any]]" = OrderedDict()
+    _read_cache_lock = threading.Lock()
+    # Read-only connections for SELECT helpers (see read_conn); opened lazily up to the limit
+    _READ_POOL_SIZE = 4
+    _read_pool: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+    _read_conns_opened = 0
 
     @classmethod
     def conn(cls) -> sqlite3.Connection:
         if cls._conn is None:
             with cls._lock:
                 if cls._conn is None:
-                    cls._conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+                    # One shared connection for the process: keeps SQLite's page cache and
+                    # the prepared-statement cache warm across requests.
+                    cls._conn = sqlite3.connect(
+                        DB_PATH, check_same_thread=False, cached_statements=256, factory=_WriterConnection
+                    )
                     # Use Row factory for name-based column access
                     cls._conn.row_factory = sqlite3.Row
                     try:
                         cls._conn.execute("PRAGMA foreign_keys = ON")
+                        # WAL lets readers proceed while a write is in flight; NORMAL sync is
+                        # durable in WAL mode and avoids an fsync per commit.
+                        cls._conn.execute("PRAGMA journal_mode = WAL")
+                        cls._conn.execute("PRAGMA synchronous = NORMAL")
+                        cls._conn.execute("PRAGMA temp_store = MEMORY")
+                        # Wait for a concurrent writer (e.g. another worker process) instead of failing with SQLITE_BUSY
+                        cls._conn.execute("PRAGMA busy_timeout = 5000")
+                        cls._conn.execute("PRAGMA cache_size = -65536")
+                        # Memory-map up to 256 MB of the DB file so reads skip a copy into the page cache
+                        cls._conn.execute("PRAGMA mmap_size = 268435456")
                     except Exception:
                         pass
+        # Create/migrate the schema once per process; afterwards conn() is just attribute reads
+        if not cls._schema_ready:
+            with cls._lock:
+                if not cls._schema_ready:
                     cls.init_schema()
-        # Ensure schema exists (idempotent) in case the connection persisted across code changes
+                    cls._schema_ready = True
+        return cls._conn
+
+    @classmethod
+    def _open_reader(cls) -> sqlite3.Connection:
+        rc = sqlite3.connect(
+            Path(DB_PATH).resolve().as_uri() + "?mode=ro", uri=True, check_same_thread=False, cached_statements=256
+        )
+        rc.row_factory = sqlite3.Row
         try:
-            cls.init_schema()
+            rc.execute("PRAGMA busy_timeout = 5000")
+            rc.execute("PRAGMA cache_size = -16384")
+            rc.execute("PRAGMA mmap_size = 268435456")
         except Exception:
             pass
-        return cls._conn
+        return rc
+
+    @classmethod
+    @contextmanager
+    def read_conn(cls) -> Iterator[sqlite3.Connection]:
+        """A read-only connection from the pool, so SELECTs run in parallel with each other
+        and with the writer (WAL) instead of queueing on the shared connection.
+
+        Inside this thread's transaction() block the writer itself is used, so a read
+        never misses writes made earlier in the same transaction; other threads keep
+        reading committed data from the pool. Do not nest.
+        """
+        writer = cls.conn()
+        if getattr(cls._tx_local, "depth", 0) > 0:
+            yield writer
+            return
+        try:
+            rc = cls._read_pool.get_nowait()
+        except queue.Empty:
+            with cls._lock:
+                can_open = cls._read_conns_opened < cls._READ_POOL_SIZE
+                if can_open:
+                    cls._read_conns_opened += 1
+            if can_open:
+                try:
+                    rc = cls._open_reader()
+                except Exception:
+                    with cls._lock:
+                        cls._read_conns_opened -= 1
+                    raise
+            else:
+                rc = cls._read_pool.get()
+        try:
+            yield rc
+        finally:
+            cls._read_pool.put(rc)
+
+    @classmethod
+    def _cached(cls, key: Tuple[Any, ...], load: Callable[[], Any]) -> Any:
+        """Return a private copy of load() from the read cache, loading it on a miss."""
+        conn = cls.conn()
+
+        def tag() -> Optional[int]:
+            # Both flags under the write lock, so no statement lands between the two reads.
+            # total_changes already counts an open transaction's writes, so an entry tagged
+            # then would outlive its commit or rollback: no tag, no caching. A busy writer
+            # also means no tag, so readers never wait on the lock.
+            if not _WRITE_LOCK.acquire(blocking=False):
+                return None
+            try:
+                return None if conn.in_transaction else conn.total_changes
+            finally:
+                _WRITE_LOCK.release()
+
+        changes = tag()
+        if changes is None:
+            return load()
+        with cls._read_cache_lock:
+            hit = cls._read_cache.get(key)
+            if hit is not None and hit[0] == changes and hit[1] > time.monotonic():
+                cls._read_cache.move_to_end(key)
+                return copy.deepcopy(hit[2])
+        value = load()
+        # A write that ran while load() was reading may not be in value; don't store it
+        if tag() != changes:
+            return value
+        with cls._read_cache_lock:
+            cls._read_cache[key] = (changes, time.monotonic() + cls._READ_CACHE_TTL, value)
+            cls._read_cache.move_to_end(key)
+            while len(cls._read_cache) > cls._READ_CACHE_MAX:
+                cls._read_cache.popitem(last=False)
+        return copy.deepcopy(value)
+
+    @classmethod
+    @contextmanager
+    def transaction(cls) -> Iterator[sqlite3.Connection]:
+        """Run a group of writes as one BEGIN IMMEDIATE ... COMMIT.
+
+        The block either commits once on exit or rolls back on any exception. Nested
+        blocks on the same thread join the outermost transaction, so helpers that use
+        transaction() can be composed into a single commit.
+        """
+        conn = cls.conn()
+        with cls._tx_lock:
+            depth = getattr(cls._tx_local, "depth", 0)
+            if depth:
+                cls._tx_local.depth = depth + 1
+                try:
+                    yield conn
+                finally:
+                    cls._tx_local.depth = depth
+                return
+            if conn.in_transaction:
+                # Flush any implicit transaction left open by an earlier statement
+                conn.commit()
+            conn.execute("BEGIN IMMEDIATE")
+            cls._tx_local.depth = 1
+            try:
+                yield conn
+            except BaseException:
+                conn.rollback()
+                raise
+            else:
+                conn.commit()
+            finally:
+                cls._tx_local.depth = 0
 
     @classmethod
     def init_schema(cls) -> None:
         c = cls._conn.cursor()
+        # Up-to-date databases need none of the CREATE/ALTER/backfill steps below
+        try:
+            if c.execute("PRAGMA user_version").fetchone()[0] >= cls._SCHEMA_VERSION:
+                return
+        except Exception:
+            pass
+        # Ids stay TEXT: besides legacy numeric ids we store hex ids (_new_id) and
+        # composite MangaDex ids ("mdx_<uuid>_<ms>", "<series>_ch<n>_<ms>"), so an
+        # INTEGER key / rowid alias cannot represent them.
         # Legacy tables (kept for backward compatibility) and new consolidated storage
         c.execute(
             """
@@ -349,6 +681,103 @@ class EditorDB:
                 c.execute("ALTER TABLE manga_series ADD COLUMN story_summary TEXT DEFAULT ''")
         except Exception:
             pass
+
+        # Panel upserts target (project_id, page_number, panel_index). The PRIMARY KEY
+        # provides that constraint; very old panels tables were created without it.
+        try:
+            pk_cols = [row[1] for row in c.execute("PRAGMA table_info(panels)").fetchall() if row[5]]
+            if not pk_cols:
+                c.execute("CREATE UNIQUE INDEX IF NOT EXISTS ux_panels_ppp ON panels(project_id, page_number, panel_index)")
+        except Exception:
+            pass
+        # Legacy image-less rows are looked up on every orphan cleanup; a partial index holds
+        # only those rows, so the check stays a tiny lookup however many panels exist.
+        try:
+            c.execute(
+                "CREATE INDEX IF NOT EXISTS ix_panels_orphan ON panels(project_id, page_number) "
+                "WHERE image_path IS NULL OR image_path=''"
+            )
+        except Exception:
+            pass
+        # Renumber pages still stored with legacy 0-based panel indices to 1-based. Runs
+        # once per database (gated by user_version), so readers and writers assume 1-based.
+        # If it fails the version is not recorded and the next start retries it.
+        indices_migrated = True
+        try:
+            c.execute(
+                "UPDATE panels SET panel_index = -(panel_index + 1) WHERE (project_id, page_number) IN "
+                "(SELECT project_id, page_number FROM panels GROUP BY project_id, page_number HAVING MIN(panel_index) = 0)"
+            )
+            c.execute("UPDATE panels SET panel_index = -panel_index WHERE panel_index < 0")
+        except Exception:
+            logger.exception("Renumbering 0-based panel indices failed")
+            indices_migrated = False
+        # Give the planner statistics for panels once, so it keeps choosing the
+        # (project_id, page_number, panel_index) key for the per-panel UPDATEs.
+        # The key's prefix already covers project_id-only lookups.
+        try:
+            has_stats = c.execute(
+                "SELECT 1 FROM sqlite_master WHERE type='table' AND name='sqlite_stat1'"
+            ).fetchone() and c.execute("SELECT 1 FROM sqlite_stat1 WHERE tbl='panels' LIMIT 1").fetchone()
+            if not has_stats:
+                c.execute("ANALYZE panels")
+        except Exception:
+            pass
+
+        # Upstream panel-detection responses keyed by page image content + request params
+        c.execute(
+            """
+            CREATE TABLE IF NOT EXISTS panel_cache (
+                img_hash TEXT NOT NULL,
+                params_hash TEXT NOT NULL,
+                response_blob BLOB NOT NULL,
+                content_type TEXT NOT NULL DEFAULT '',
+                created_at TEXT NOT NULL,
+                project_id TEXT,
+                PRIMARY KEY (img_hash, params_hash)
+            );
+            """
+        )
+        # project_id (the project that last stored the entry) lets delete_project drop its rows
+        try:
+            cols = {row[1] for row in c.execute("PRAGMA table_info(panel_cache)").fetchall()}
+            if "project_id" not in cols:
+                c.execute("ALTER TABLE panel_cache ADD COLUMN project_id TEXT")
+            c.execute("CREATE INDEX IF NOT EXISTS ix_panel_cache_project ON panel_cache(project_id)")
+            c.execute("CREATE INDEX IF NOT EXISTS ix_panel_cache_created ON panel_cache(created_at)")
+        except Exception:
+            pass
+
+        # Indexes for series -> chapter lookups. The composite index also serves
+        # plain manga_series_id lookups, so it replaces the single-column one.
+        try:
+            c.execute("CREATE INDEX IF NOT EXISTS idx_pd_series_chap ON project_details(manga_series_id, chapter_number)")
+            c.execute("DROP INDEX IF EXISTS idx_pd_series")
+        except Exception:
+            pass
+
+        # Page lists live in the pages table. Rebuild the rows of any project whose table
+        # entries don't match its pages_json (projects written before the table was used).
+        try:
+            stale = [r[0] for r in c.execute(
+                "SELECT id FROM project_details pd WHERE json_valid(pages_json) AND "
+                "json_array_length(pages_json) <> (SELECT COUNT(*) FROM pages p WHERE p.project_id = pd.id)"
+            ).fetchall()]
+            for pid in stale:
+                c.execute(
+                    "INSERT OR IGNORE INTO projects(id, title, created_at) SELECT id, title, created_at FROM project_details WHERE id=?",
+                    (pid,),
+                )
+                c.execute("DELETE FROM pages WHERE project_id=?", (pid,))
+                c.execute(
+                    "INSERT OR REPLACE INTO pages(project_id, page_number, image_path) "
+                    "SELECT pd.id, COALESCE(CAST(json_extract(j.value, '$.page_number') AS INTEGER), j.key + 1), "
+                    "COALESCE(json_extract(j.value, '$.image_path'), '') "
+                    "FROM project_details pd, json_each(pd.pages_json) j WHERE pd.id=?",
+                    (pid,),
+                )
+        except Exception:
+            logger.exception("Backfilling the pages table failed")
         
         cls._conn.commit()
         
@@ -359,30 +788,36 @@ class EditorDB:
         except Exception:
             pass
 
+        if not indices_migrated:
+            return
+        try:
+            c.execute(f"PRAGMA user_version = {int(cls._SCHEMA_VERSION)}")
+            cls._conn.commit()
+        except Exception:
+            logger.exception("Recording the schema version failed")
+
     @classmethod
     def save_project_layers(cls, project_id: str, layers_data: List[Dict[str, Any]]) -> None:
         now = datetime.utcnow().isoformat()
-        conn = cls.conn()
-        
-        # Get current metadata or initialize it
-        row = conn.execute("SELECT metadata_json FROM project_details WHERE id=?", (project_id,)).fetchone()
-        if row:
-            try:
-                metadata = json.loads(row[0] or '{}')
-            except (json.JSONDecodeError, TypeError):
+        with cls.transaction() as conn:
+            # Get current metadata or initialize it
+            row = conn.execute("SELECT metadata_json FROM project_details WHERE id=?", (project_id,)).fetchone()
+            if row:
+                try:
+                    metadata = _json_loads(row[0] or '{}')
+                except (json.JSONDecodeError, TypeError):
+                    metadata = {}
+            else:
+                # This case should ideally not happen if project exists, but handle defensively
                 metadata = {}
-        else:
-            # This case should ideally not happen if project exists, but handle defensively
-            metadata = {}
-            
-        metadata['layers'] = layers_data
-        metadata['layers_updated_at'] = now
-        
-        conn.execute(
-            "UPDATE project_details SET metadata_json=? WHERE id=?",
-            (json.dumps(metadata), project_id)
-        )
-        conn.commit()
+
+            metadata['layers'] = layers_data
+            metadata['layers_updated_at'] = now
+
+            conn.execute(
+                "UPDATE project_details SET metadata_json=? WHERE id=?",
+                (_json_dumps(metadata), project_id)
+            )
 
     # -------- Projects CRUD --------
     @classmethod
@@ -404,75 +839,58 @@ class EditorDB:
         if title and not name:
             name = title
         if not project_id:
-            project_id = str(int(datetime.utcnow().timestamp() * 1000))
+            project_id = _new_id()
         
         now = datetime.utcnow().isoformat()
-        conn = cls.conn()
         
         # Process files if provided
         pages = []
         if files:
-            def _norm(p: str) -> str:
-                if not isinstance(p, str):
-                    return ""
-                p = p.strip()
-                if not p:
-                    return p
-                if p.startswith("http://") or p.startswith("https://"):
-                    return p
-                if p.startswith("/uploads/") or p.startswith("uploads/"):
-                    return p if p.startswith("/") else ("/" + p)
-                if p.startswith("/manga_projects/") or p.startswith("manga_projects/"):
-                    return p if p.startswith("/") else ("/" + p)
-                # Assume it's a bare filename coming from /upload
-                base = os.path.basename(p)
-                return f"/uploads/{base}"
-            pages = [{"page_number": i, "image_path": _norm(path)} for i, path in enumerate(files, start=1)]
+            pages = [{"page_number": i, "image_path": _norm_page_path(path)} for i, path in enumerate(files, start=1)]
         
-        # Backfill legacy 'projects' table for compatibility with any old FKs
-        try:
+        with cls.transaction() as conn:
+            # Backfill legacy 'projects' table for compatibility with any old FKs
+            try:
+                conn.execute(
+                    "INSERT OR IGNORE INTO projects(id, title, created_at) VALUES(?,?,?)",
+                    (project_id, name or title, now),
+                )
+            except Exception:
+                pass
+
             conn.execute(
-                "INSERT OR IGNORE INTO projects(id, title, created_at) VALUES(?,?,?)",
-                (project_id, name or title, now),
+                """INSERT INTO project_details(
+                    id, title, created_at, pages_json, character_markdown, metadata_json,
+                    manga_series_id, chapter_number, mangadex_chapter_id, mangadex_chapter_url, chapter_pages_count, has_images, narration_provider
+                ) VALUES(?,?,?,?,?,?,?,?,?,?,?,?,?)""",
+                (
+                    project_id,
+                    name or title,
+                    now,
+                    _json_dumps(pages),
+                    "",
+                    "{}",
+                    manga_series_id,
+                    chapter_number,
+                    mangadex_chapter_id,
+                    mangadex_chapter_url,
+                    chapter_pages_count,
+                    has_images,
+                    narration_provider,
+                ),
             )
-        except Exception:
-            pass
-        
-        conn.execute(
-            """INSERT INTO project_details(
-                id, title, created_at, pages_json, character_markdown, metadata_json,
-                manga_series_id, chapter_number, mangadex_chapter_id, mangadex_chapter_url, chapter_pages_count, has_images, narration_provider
-            ) VALUES(?,?,?,?,?,?,?,?,?,?,?,?,?)""",
-            (
-                project_id,
-                name or title,
-                now,
-                json.dumps(pages),
-                "",
-                json.dumps({}),
-                manga_series_id,
-                chapter_number,
-                mangadex_chapter_id,
-                mangadex_chapter_url,
-                chapter_pages_count,
-                has_images,
-                narration_provider,
-            ),
-        )
-        conn.commit()
+            cls._store_pages(conn, project_id, pages, write_json=False)
         return {"id": project_id, "title": name or title, "created_at": now, "chapters": len(files) if files else 0}
 
     @classmethod
     def list_projects(cls) -> List[Dict[str, Any]]:
-        rows = cls.conn().execute("SELECT id, title, created_at, pages_json FROM project_details ORDER BY created_at DESC").fetchall()
+        rows = cls.conn().execute(
+            "SELECT id, title, created_at, (SELECT COUNT(*) FROM pages p WHERE p.project_id = pd.id) "
+            "FROM project_details pd ORDER BY created_at DESC"
+        ).fetchall()
         out: List[Dict[str, Any]] = []
         for r in rows:
-            try:
-                pages = json.loads(r[3] or "[]")
-                cnt = len(pages)
-            except Exception:
-                cnt = 0
-            out.append({"id": r[0], "title": r[1], "createdAt": r[2], "chapters": int(cnt), "status": "uploaded"})
+            out.append({"id": r[0], "title": r[1], "createdAt": r[2], "chapters": int(r[3] or 0), "status": "uploaded"})
         return out
 
     @classmethod
@@ -480,7 +898,7 @@ class EditorDB:
         """Return a compact list of recent projects with a fast allPanelsReady check.
 
         The implementation uses two queries:
-        - select recent projects with pages_json and minimal metadata
+        - select recent projects with their page count (pages table) and minimal metadata
         - a single aggregated query to count distinct panel page_numbers per project
           so we can determine if every page has at least one panel without loading
           panel rows for each project.
@@ -488,7 +906,8 @@ class EditorDB:
         conn = cls.conn()
         # Fetch recent projects
         rows = conn.execute(
-            "SELECT id, title, created_at, pages_json, metadata_json, manga_series_id, has_images FROM project_details ORDER BY created_at DESC LIMIT ?",
+            "SELECT id, title, created_at, (SELECT COUNT(*) FROM pages p WHERE p.project_id = pd.id), "
+            "metadata_json, manga_series_id, has_images FROM project_details pd ORDER BY created_at DESC LIMIT ?",
             (limit,),
         ).fetchall()
 
@@ -512,11 +931,7 @@ class EditorDB:
         out: List[Dict[str, Any]] = []
         for r in rows:
             pid = r[0]
-            try:
-                pages = json.loads(r[3] or "[]")
-                page_count = len(pages)
-            except Exception:
-                page_count = 0
+            page_count = int(r[3] or 0)
 
             distinct_pages = distinct_map.get(pid, 0)
             all_panels_ready = (page_count > 0) and (distinct_pages >= page_count)
@@ -524,7 +939,7 @@ class EditorDB:
 
             # Parse metadata JSON to expose manga_series_id when present
             try:
-                metadata = json.loads(r[4] or "{}")
+                metadata = _json_loads(r[4] or "{}")
             except Exception:
                 metadata = {}
 
@@ -545,20 +960,26 @@ class EditorDB:
 
     @classmethod
     def get_project(cls, project_id: str) -> Optional[Dict[str, Any]]:
-        row = cls.conn().execute(
-            "SELECT id, title, created_at, pages_json, metadata_json, manga_series_id, narration_provider FROM project_details WHERE id=?", 
-            (project_id,)
-        ).fetchone()
+        return cls._cached(("project", project_id), lambda: cls._load_project(project_id))
+
+    @classmethod
+    def _load_project(cls, project_id: str) -> Optional[Dict[str, Any]]:
+        with cls.read_conn() as rc:
+            row = rc.execute(
+                "SELECT id, title, created_at, metadata_json, manga_series_id, narration_provider FROM project_details WHERE id=?", 
+                (project_id,)
+            ).fetchone()
+            # The pages table is the source of truth; pages_json is only a compat copy
+            page_rows = rc.execute(
+                "SELECT page_number, image_path FROM pages WHERE project_id=? ORDER BY page_number", (project_id,)
+            ).fetchall() if row else []
         if not row:
             return None
 
-        try:
-            pages_data = json.loads(row["pages_json"] or "[]")
-        except (json.JSONDecodeError, TypeError):
-            pages_data = []
+        pages_data = [{"page_number": int(r[0]), "image_path": r[1]} for r in page_rows]
 
         try:
-            metadata = json.loads(row["metadata_json"] or "{}")
+            metadata = _json_loads(row["metadata_json"] or "{}")
         except (json.JSONDecodeError, TypeError):
             metadata = {}
 
@@ -572,14 +993,14 @@ class EditorDB:
              pass
 
         # Add manga_series_id to the project data
-        series_id = row["manga_series_id"] if len(row) > 5 else None
+        series_id = row["manga_series_id"] if len(row) > 4 else None
 
         # To provide the full details the video editor needs, we must also fetch the panels for each page.
         full_pages = []
         for page_info in pages_data:
             page_number = page_info.get("page_number")
             if page_number is not None:
-                panels = cls.get_panels_for_page(project_id, page_number)
+                panels = cls._load_panels_for_page(project_id, page_number)
                 # The frontend JS expects `image_path` and `audio_path` for panels
                 enriched_panels = []
                 for p in panels:
@@ -606,58 +1027,196 @@ class EditorDB:
 
     @classmethod
     def get_pages(cls, project_id: str) -> List[Dict[str, Any]]:
-        row = cls.conn().execute("SELECT pages_json FROM project_details WHERE id=?", (project_id,)).fetchone()
-        if not row:
-            return []
-        try:
-            pages = json.loads(row[0] or "[]")
-        except Exception:
-            pages = []
-        pages = sorted(pages, key=lambda p: int(p.get("page_number") or 0))
-        return [{"page_number": int(p.get("page_number") or i + 1), "image_path": p.get("image_path")} for i, p in enumerate(pages)]
+        return cls._cached(("pages", project_id), lambda: cls._load_pages(project_id))
 
     @classmethod
-    def delete_project(cls, project_id: str) -> None:
-        c = cls.conn()
-        c.execute("DELETE FROM panels WHERE project_id=?", (project_id,))
-        c.execute("DELETE FROM project_details WHERE id=?", (project_id,))
-        # Clean up legacy projects row if present
-        try:
-            c.execute("DELETE FROM projects WHERE id=?", (project_id,))
-        except Exception:
-            pass
-        c.commit()
+    def _load_pages(cls, project_id: str) -> List[Dict[str, Any]]:
+        with cls.read_conn() as rc:
+            rows = rc.execute(
+                "SELECT page_number, image_path FROM pages WHERE project_id=? ORDER BY page_number", (project_id,)
+            ).fetchall()
+        return [{"page_number": int(r[0]), "image_path": r[1]} for r in rows]
 
     @classmethod
-    def set_panels_for_page(cls, project_id: str, page_number: int, panel_paths: List[str]) -> None:
-        c = cls.conn()
-        now = datetime.utcnow().isoformat()
-        # Compatibility: ensure a row exists in legacy 'projects' for old FK constraints
+    def _store_pages(cls, tx: sqlite3.Connection, project_id: str, pages: List[Dict[str, Any]], write_json: bool = True) -> None:
+        """Replace a project's rows in the pages table; call inside transaction().
+
+        pages_json is rewritten as well while _WRITE_PAGES_JSON is on (write_json=False when
+        the caller inserts the project_details row with it).
+        """
+        # pages references the legacy projects table
+        tx.execute(
+            "INSERT OR IGNORE INTO projects(id, title, created_at) SELECT id, title, created_at FROM project_details WHERE id=?",
+            (project_id,),
+        )
+        tx.execute("DELETE FROM pages WHERE project_id=?", (project_id,))
+        tx.executemany(
+            "INSERT OR REPLACE INTO pages(project_id, page_number, image_path) VALUES(?,?,?)",
+            [(project_id, int(p.get("page_number") or i), p.get("image_path") or "") for i, p in enumerate(pages, start=1)],
+        )
+        if write_json and cls._WRITE_PAGES_JSON:
+            tx.execute("UPDATE project_details SET pages_json=? WHERE id=?", (_json_dumps(pages), project_id))
+
+    @classmethod
+    def set_project_pages(cls, project_id: str, pages: List[Dict[str, Any]]) -> None:
+        """Replace a project's page list (dicts with page_number and image_path) in one transaction."""
+        with cls.transaction() as tx:
+            cls._store_pages(tx, project_id, pages)
+
+    @classmethod
+    def _renumber_metadata_pages(cls, tx: sqlite3.Connection, project_id: str, renumber: Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]]) -> None:
+        """Apply renumber() to metadata["pages"] of a project, if present; call inside transaction()."""
+        row = tx.execute("SELECT metadata_json FROM project_details WHERE id=?", (project_id,)).fetchone()
         try:
-            c.execute(
-                "INSERT OR IGNORE INTO projects(id, title, created_at) SELECT id, title, created_at FROM project_details WHERE id=?",
-                (project_id,)
+            metadata = _json_loads(row[0] or "{}") if row else {}
+        except (json.JSONDecodeError, TypeError):
+            metadata = {}
+        if "pages" in metadata:
+            metadata["pages"] = renumber(metadata["pages"])
+            tx.execute("UPDATE project_details SET metadata_json=? WHERE id=?", (_json_dumps(metadata), project_id))
+
+    @classmethod
+    def delete_page(cls, project_id: str, page_number: int) -> Optional[int]:
+        """Remove a page and renumber the remaining pages 1..N (pages and metadata) in one transaction.
+
+        Returns the number of remaining pages, or None if the page does not exist.
+        """
+        def drop(pages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            kept = sorted((p for p in pages if p.get("page_number") != page_number), key=lambda x: x.get("page_number", 0))
+            for idx, page in enumerate(kept, start=1):
+                page["page_number"] = idx
+            return kept
+
+        with cls.transaction() as tx:
+            pages = cls._load_pages(project_id)
+            if not any(p["page_number"] == page_number for p in pages):
+                return None
+            updated_pages = drop(pages)
+            cls._store_pages(tx, project_id, updated_pages)
+            cls._renumber_metadata_pages(tx, project_id, drop)
+        return len(updated_pages)
+
+    @classmethod
+    def reorder_pages(cls, project_id: str, new_pages: List[Dict[str, Any]]) -> int:
+        """Give the project's pages, in their current order, the page_numbers of new_pages.
+
+        Page metadata is renumbered with the same old -> new mapping, in the same transaction.
+        Returns the number of pages stored.
+        """
+        with cls.transaction() as tx:
+            current_pages = cls._load_pages(project_id)
+            # Map old page numbers to new page numbers by position
+            page_number_map = {
+                old["page_number"]: new.get("page_number") for old, new in zip(current_pages, new_pages)
+            }
+            updated_pages = [
+                {**old, "page_number": new.get("page_number")} for old, new in zip(current_pages, new_pages)
+            ]
+
+            def remap(meta_pages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+                for meta_page in meta_pages:
+                    old_num = meta_page.get("page_number")
+                    if old_num in page_number_map:
+                        meta_page["page_number"] = page_number_map[old_num]
+                return meta_pages
+
+            cls._store_pages(tx, project_id, updated_pages)
+            cls._renumber_metadata_pages(tx, project_id, remap)
+        return len(updated_pages)
+
+    @classmethod
+    def delete_panel(cls, project_id: str, page_number: int, panel_index: int) -> Optional[int]:
+        """Delete one panel and re-index the page's remaining panels 1..N in one transaction.
+
+        Returns the number of remaining panels, or None if the panel does not exist.
+        """
+        # One timestamp for the whole re-insert rather than two clock reads per panel
+        now = datetime.now().isoformat()
+        with cls.transaction() as tx:
+            rows = tx.execute(
+                "SELECT panel_index, image_path, narration_text, is_manual, audio_url, effect, transition FROM panels WHERE project_id=? AND page_number=? ORDER BY panel_index ASC",
+                (project_id, page_number)
+            ).fetchall()
+            remaining = [r for r in rows if int(r[0]) != panel_index]
+            if len(remaining) == len(rows):
+                return None
+            tx.execute("DELETE FROM panels WHERE project_id=? AND page_number=?", (project_id, page_number))
+            # Re-insert with new sequential indices
+            # r: (panel_index, image_path, narration_text, is_manual, audio_url, effect, transition)
+            tx.executemany(
+                """
+                INSERT INTO panels (project_id, page_number, panel_index, image_path, narration_text, is_manual, audio_url, effect, transition, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (project_id, page_number, new_index, r[1], r[2], r[3], r[4], r[5], r[6], now, now)
+                    for new_index, r in enumerate(remaining, start=1)
+                ],
             )
-        except Exception:
-            pass
-        c.execute("DELETE FROM panels WHERE project_id=? AND page_number=?", (project_id, page_number))
+        return len(remaining)
+
+    @classmethod
+    def set_project_images(cls, project_id: str, image_paths: List[str]) -> None:
+        """Replace a project's page images (page_number 1..N) in one transaction."""
+        pages = [{"page_number": i, "image_path": path} for i, path in enumerate(image_paths, start=1)]
+        with cls.transaction() as tx:
+            cls._store_pages(tx, project_id, pages)
+            tx.execute("UPDATE project_details SET has_images=1 WHERE id=?", (project_id,))
+
+    @classmethod
+    def delete_project(cls, project_id: str) -> None:
+        with cls.transaction() as c:
+            c.execute("DELETE FROM panels WHERE project_id=?", (project_id,))
+            c.execute("DELETE FROM pages WHERE project_id=?", (project_id,))
+            c.execute("DELETE FROM panel_cache WHERE project_id=?", (project_id,))
+            c.execute("DELETE FROM project_details WHERE id=?", (project_id,))
+            # Clean up legacy projects row if present
+            try:
+                c.execute("DELETE FROM projects WHERE id=?", (project_id,))
+            except Exception:
+                pass
+
+    @classmethod
+    def set_panels_for_page(cls, project_id: str, page_number: int, panel_paths: List[str], now: Optional[str] = None) -> None:
+        now = now or datetime.utcnow().isoformat()
         # Store panel_index as 1-based for clearer UX and consistent mapping with UI
-        for idx, p in enumerate(panel_paths, start=1):
-            c.execute(
+        rows = [
+            (project_id, page_number, idx, p, "", None, now, now, "zoom_in", "slide_book")
+            for idx, p in enumerate(panel_paths, start=1)
+        ]
+        with cls.transaction() as c:
+            # Compatibility: ensure a row exists in legacy 'projects' for old FK constraints
+            try:
+                c.execute(
+                    "INSERT OR IGNORE INTO projects(id, title, created_at) SELECT id, title, created_at FROM project_details WHERE id=?",
+                    (project_id,)
+                )
+            except Exception:
+                pass
+            c.execute("DELETE FROM panels WHERE project_id=? AND page_number=?", (project_id, page_number))
+            c.executemany(
                 "INSERT INTO panels(project_id, page_number, panel_index, image_path, narration_text, audio_url, created_at, updated_at, effect, transition) VALUES(?,?,?,?,?,?,?,?,?,?)",
-                (project_id, page_number, idx, p, "", None, now, now, "zoom_in", "slide_book"),
+                rows,
             )
-        c.commit()
+
+    @classmethod
+    def set_panels_for_pages(cls, project_id: str, pages: List[Tuple[int, List[str]]]) -> None:
+        """Replace the panels of several pages in one transaction (one commit)."""
+        now = datetime.utcnow().isoformat()
+        with cls.transaction():
+            for page_number, panel_paths in pages:
+                cls.set_panels_for_page(project_id, page_number, panel_paths, now=now)
 
     @classmethod
     def set_project_provider(cls, project_id: str, provider: str) -> None:
         """Update the narration provider for a specific project/chapter."""
         try:
-            cls.conn().execute(
+            conn = cls.conn()
+            conn.execute(
                 "UPDATE project_details SET narration_provider=? WHERE id=?",
                 (provider, project_id)
             )
-            cls.conn().commit()
+            conn.commit()
         except Exception as e:
             # If column doesn't exist, it might fail silently or we should log it
             # But the schema init adds it, so it should be fine.
@@ -665,48 +1224,105 @@ class EditorDB:
 
     @classmethod
     def get_panels_for_page(cls, project_id: str, page_number: int) -> List[Dict[str, Any]]:
-        # Check if is_manual column exists (it should after migration)
-        try:
-            rows = cls.conn().execute(
-                "SELECT panel_index, image_path, narration_text, audio_url, effect, transition, is_manual FROM panels WHERE project_id=? AND page_number=? ORDER BY panel_index ASC",
-                (project_id, page_number),
-            ).fetchall()
-        except Exception:
-            # Fallback if column missing (though migration should have run)
-            rows = cls.conn().execute(
-                "SELECT panel_index, image_path, narration_text, audio_url, effect, transition FROM panels WHERE project_id=? AND page_number=? ORDER BY panel_index ASC",
-                (project_id, page_number),
-            ).fetchall()
+        return cls._cached(("panels", project_id, page_number), lambda: cls._load_panels_for_page(project_id, page_number))
+
+    @classmethod
+    def _load_panels_for_page(cls, project_id: str, page_number: int) -> List[Dict[str, Any]]:
+        with cls.read_conn() as conn:
+            # Check if is_manual column exists (it should after migration)
+            try:
+                rows = conn.execute(
+                    _SQL_SELECT_PAGE_PANELS,
+                    (project_id, page_number),
+                ).fetchall()
+            except Exception:
+                # Fallback if column missing (though migration should have run)
+                rows = conn.execute(
+                    _SQL_SELECT_PAGE_PANELS_LEGACY,
+                    (project_id, page_number),
+                ).fetchall()
 
         out: List[Dict[str, Any]] = []
         for r in rows:
-            # Skip legacy/erroneous rows that have no image; these were created by older narration code
-            img_path = (r[1] or "").strip()
-            if not img_path:
-                continue
-            idx_db = int(r[0])
-            # If legacy rows used 0-based, display as 1-based
-            display_idx = (idx_db + 1) if idx_db == 0 else idx_db
-            eff = (r[4] if len(r) > 4 else None) or "zoom_in"
-            trans = (r[5] if len(r) > 5 else None) or "slide_book"
-            is_manual = bool(r[6]) if len(r) > 6 else False
-            
-            out.append({
-                "index": int(display_idx),
-                "image": img_path,
-                "text": r[2] or "",
-                "audio": r[3],
-                "effect": eff,
-                "transition": trans,
-                "is_manual": is_manual,
-            })
+            panel = cls._panel_from_row(r)
+            if panel is not None:
+                out.append(panel)
+        return out
+
+    @classmethod
+    def get_page_panel_count(cls, project_id: str, page_number: int) -> Optional[int]:
+        """Number of panels (with an image) on a page, or None if the project does not exist.
+
+        Validates the project and counts its panels in one round trip.
+        """
+        with cls.read_conn() as rc:
+            row = rc.execute(
+                "SELECT (SELECT 1 FROM project_details WHERE id=?), "
+                "(SELECT COUNT(*) FROM panels WHERE project_id=? AND page_number=? AND TRIM(COALESCE(image_path, '')) <> '')",
+                (project_id, project_id, page_number),
+            ).fetchone()
+        if not row or row[0] is None:
+            return None
+        return int(row[1] or 0)
+
+    @classmethod
+    def get_page_panel_indices(cls, project_id: str, page_number: int) -> Optional[List[int]]:
+        """panel_index of every panel (with an image) on a page, or None if the project does not exist."""
+        with cls.read_conn() as rc:
+            if rc.execute("SELECT 1 FROM project_details WHERE id=?", (project_id,)).fetchone() is None:
+                return None
+            rows = rc.execute(
+                "SELECT panel_index FROM panels WHERE project_id=? AND page_number=? AND TRIM(COALESCE(image_path, '')) <> '' "
+                "ORDER BY panel_index",
+                (project_id, page_number),
+            ).fetchall()
+        return [int(r[0]) for r in rows]
+
+    @staticmethod
+    def _panel_from_row(r: Any) -> Optional[Dict[str, Any]]:
+        """Map a (panel_index, image_path, narration_text, audio_url, effect, transition[, is_manual]) row."""
+        # Skip legacy/erroneous rows that have no image; these were created by older narration code
+        img_path = (r[1] or "").strip()
+        if not img_path:
+            return None
+        eff = (r[4] if len(r) > 4 else None) or "zoom_in"
+        trans = (r[5] if len(r) > 5 else None) or "slide_book"
+        is_manual = bool(r[6]) if len(r) > 6 else False
+        
+        return {
+            "index": int(r[0]),
+            "image": img_path,
+            "text": r[2] or "",
+            "audio": r[3],
+            "effect": eff,
+            "transition": trans,
+            "is_manual": is_manual,
+        }
+
+    @classmethod
+    def get_panels_for_project(cls, project_id: str) -> Dict[int, List[Dict[str, Any]]]:
+        """Panels of every page in one query, keyed by page number (same shape as get_panels_for_page)."""
+        with cls.read_conn() as rc:
+            rows = rc.execute(
+                "SELECT panel_index, image_path, narration_text, audio_url, effect, transition, is_manual, page_number "
+                "FROM panels WHERE project_id=? ORDER BY page_number ASC, panel_index ASC",
+                (project_id,),
+            ).fetchall()
+        out: Dict[int, List[Dict[str, Any]]] = {}
+        for pn, group in itertools.groupby(rows, key=lambda r: int(r[7])):
+            panels = [p for p in map(cls._panel_from_row, group) if p is not None]
+            if panels:
+                out[pn] = panels
         return out
 
     @classmethod
     def get_series_projects(cls, series_id: str) -> List[Dict[str, Any]]:
         """Get all projects for a series, sorted by chapter number"""
         rows = cls.conn().execute(
-            "SELECT id, title, chapter_number, pages_json FROM project_details WHERE manga_series_id=? ORDER BY chapter_number ASC",
+            "SELECT id, title, chapter_number, "
+            "(SELECT json_group_array(json_object('page_number', page_number, 'image_path', image_path)) "
+            "FROM (SELECT page_number, image_path FROM pages p WHERE p.project_id = pd.id ORDER BY page_number)) "
+            "FROM project_details pd WHERE manga_series_id=? ORDER BY chapter_number ASC",
             (series_id,)
         ).fetchall()
         
@@ -726,21 +1342,14 @@ class EditorDB:
         """Return True if every page listed for the project has at least one panel recorded in the panels table.
 
         This is implemented with a small SQL query that counts distinct page_number entries in `panels`
-        for the project and compares against the number of pages in the project's pages_json. This
+        for the project and compares against the number of rows in the `pages` table. This
         avoid`s loading full panel rows (and any heavy processing) when callers only need a yes/no
         about whether panels exist for all pages.
         """
         try:
             conn = cls.conn()
-            row = conn.execute("SELECT pages_json FROM project_details WHERE id=?", (project_id,)).fetchone()
-            if not row:
-                return False
-            try:
-                pages = json.loads(row[0] or "[]")
-            except Exception:
-                pages = []
-            page_count = len(pages)
-            if page_count == 0:
+            page_count = conn.execute("SELECT COUNT(*) FROM pages WHERE project_id=?", (project_id,)).fetchone()[0]
+            if not page_count:
                 return False
             # Count distinct page_number values that have an image (skip empty/NULL image rows)
             r = conn.execute(
@@ -756,10 +1365,11 @@ class EditorDB:
 
     @classmethod
     def get_panel_narrations(cls, project_id: str) -> Dict[Tuple[int, int], str]:
-        rows = cls.conn().execute(
-            "SELECT page_number, panel_index, narration_text FROM panels WHERE project_id=?",
-            (project_id,),
-        ).fetchall()
+        with cls.read_conn() as rc:
+            rows = rc.execute(
+                "SELECT page_number, panel_index, narration_text FROM panels WHERE project_id=?",
+                (project_id,),
+            ).fetchall()
         return {(int(r[0]), int(r[1])): (r[2] or "") for r in rows}
 
     @classmethod
@@ -768,23 +1378,74 @@ class EditorDB:
         # We only update existing panels because image_path is required for new ones
         # and panels should have been created by the panel detection step.
         conn.execute(
-            "UPDATE panels SET narration_text=?, is_manual=?, updated_at=? WHERE project_id=? AND page_number=? AND panel_index=?",
+            _SQL_UPDATE_PANEL_NARRATION,
             (text, 1 if is_manual else 0, datetime.now().isoformat(), project_id, page_number, panel_index)
         )
         conn.commit()
 
+    @classmethod
+    def set_page_narrations(cls, project_id: str, page_number: int, texts: List[Tuple[int, str]], is_manual: bool = False, purge_imageless: bool = False) -> None:
+        """Write the narration of several panels of one page in a single transaction.
+
+        texts is a list of (panel_index, text). With purge_imageless, legacy rows of the page
+        without an image are deleted in the same transaction.
+        """
+        now = datetime.now().isoformat()
+        manual = 1 if is_manual else 0
+        with cls.transaction() as tx:
+            tx.executemany(
+                _SQL_UPDATE_PANEL_NARRATION,
+                [(text, manual, now, project_id, page_number, idx) for idx, text in texts],
+            )
+            if purge_imageless:
+                tx.execute(
+                    "DELETE FROM panels WHERE project_id=? AND page_number=? AND (image_path IS NULL OR image_path='')",
+                    (project_id, page_number),
+                )
+
+    @classmethod
+    def purge_imageless_panels(cls, project_id: str, first_page: int, last_page: int) -> int:
+        """Delete legacy panel rows without an image on pages first_page..last_page; returns the row count."""
+        conn = cls.conn()
+        cur = conn.execute(
+            "DELETE FROM panels WHERE project_id=? AND page_number BETWEEN ? AND ? AND (image_path IS NULL OR image_path='')",
+            (project_id, first_page, last_page),
+        )
+        conn.commit()
+        return cur.rowcount
+
+    @classmethod
+    def cleanup_orphan_panels(cls, project_id: str) -> int:
+        """Delete a project's legacy panel rows without an image; returns the row count.
+
+        A read-only EXISTS check runs first, so projects without such rows never take the write lock.
+        """
+        conn = cls.conn()
+        exists = conn.execute(
+            "SELECT EXISTS(SELECT 1 FROM panels WHERE project_id=? AND (image_path IS NULL OR image_path=''))",
+            (project_id,),
+        ).fetchone()[0]
+        if not exists:
+            return 0
+        cur = conn.execute(
+            "DELETE FROM panels WHERE project_id=? AND (image_path IS NULL OR image_path='')",
+            (project_id,),
+        )
+        conn.commit()
+        return cur.rowcount
+
     @classmethod
     def save_manual_narration(cls, project_id: str, page_number: int, panels_data: List[Dict[str, Any]]) -> None:
         """
         Saves manually provided narrations for a page.
         panels_data is a list of dicts, each with 'panel_index' and 'text'.
         """
-        for panel_item in panels_data:
-            panel_index = panel_item.get("panel_index")
-            text = panel_item.get("text", "").strip()
-            
-            if panel_index is not None:
-                cls.upsert_panel_narration(project_id, page_number, int(panel_index), text, is_manual=True)
+        texts = [
+            (int(item["panel_index"]), item.get("text", "").strip())
+            for item in panels_data
+            if item.get("panel_index") is not None
+        ]
+        cls.set_page_narrations(project_id, page_number, texts, is_manual=True)
 
     @classmethod
     def set_character_list(cls, project_id: str, markdown: str) -> None:
@@ -794,10 +1455,15 @@ class EditorDB:
 
     @classmethod
     def get_character_list(cls, project_id: str) -> str:
-        row = cls.conn().execute(
-            "SELECT character_markdown FROM project_details WHERE id=?",
-            (project_id,),
-        ).fetchone()
+        return cls._cached(("characters", project_id), lambda: cls._load_character_list(project_id))
+
+    @classmethod
+    def _load_character_list(cls, project_id: str) -> str:
+        with cls.read_conn() as rc:
+            row = rc.execute(
+                "SELECT character_markdown FROM project_details WHERE id=?",
+                (project_id,),
+            ).fetchone()
         return row[0] if row else ""
 
     @classmethod
@@ -869,22 +1535,19 @@ class EditorDB:
         Returns:
             Number of chapters updated
         """
-        conn = cls.conn()
-        
-        # Get all chapters in the series
-        chapters = conn.execute(
-            "SELECT id FROM project_details WHERE manga_series_id=?",
-            (series_id,),
-        ).fetchall()
-        
-        # Update each chapter
-        for (chapter_id,) in chapters:
-            conn.execute(
-                "UPDATE project_details SET character_markdown=? WHERE id=?",
-                (markdown, chapter_id),
-            )
-        
-        conn.commit()
+        with cls.transaction() as conn:
+            # Get all chapters in the series
+            chapters = conn.execute(
+                "SELECT id FROM project_details WHERE manga_series_id=?",
+                (series_id,),
+            ).fetchall()
+
+            # Update each chapter
+            for (chapter_id,) in chapters:
+                conn.execute(
+                    "UPDATE project_details SET character_markdown=? WHERE id=?",
+                    (markdown, chapter_id),
+                )
         return len(chapters)
 
     @classmethod
@@ -938,14 +1601,13 @@ class EditorDB:
     @classmethod
     def create_manga_series(cls, name: str) -> Dict[str, Any]:
         """Create a new manga series."""
-        series_id = str(int(datetime.utcnow().timestamp() * 1000))
+        series_id = _new_id()
         now = datetime.utcnow().isoformat()
-        conn = cls.conn()
-        conn.execute(
-            "INSERT INTO manga_series(id, name, created_at, updated_at) VALUES(?,?,?,?)",
-            (series_id, name, now, now),
-        )
-        conn.commit()
+        with cls.transaction() as conn:
+            conn.execute(
+                "INSERT INTO manga_series(id, name, created_at, updated_at) VALUES(?,?,?,?)",
+                (series_id, name, now, now),
+            )
         return {"id": series_id, "name": name, "created_at": now, "updated_at": now}
 
     @classmethod
@@ -985,7 +1647,8 @@ class EditorDB:
     @classmethod
     def get_manga_series(cls, series_id: str) -> Optional[Dict[str, Any]]:
         """Get manga series details with all its chapters."""
-        row = cls.conn().execute(
+        conn = cls.conn()
+        row = conn.execute(
             "SELECT id, name, created_at, updated_at FROM manga_series WHERE id=?",
             (series_id,),
         ).fetchone()
@@ -993,7 +1656,7 @@ class EditorDB:
             return None
         
         # Get all chapters for this series
-        chapters = cls.conn().execute(
+        chapters = conn.execute(
             "SELECT id, title, chapter_number, created_at, mangadex_chapter_id, mangadex_chapter_url, chapter_pages_count, has_images FROM project_details WHERE manga_series_id=? ORDER BY chapter_number ASC",
             (series_id,),
         ).fetchall()
@@ -1022,52 +1685,50 @@ class EditorDB:
     @classmethod
     def list_manga_series(cls) -> List[Dict[str, Any]]:
         """List all manga series with their chapter counts."""
+        # Count chapters in the same statement instead of one COUNT(*) per series
         rows = cls.conn().execute(
-            "SELECT id, name, created_at, updated_at FROM manga_series ORDER BY updated_at DESC"
+            """
+            SELECT s.id, s.name, s.created_at, s.updated_at, COUNT(pd.id)
+            FROM manga_series s
+            LEFT JOIN project_details pd ON pd.manga_series_id = s.id
+            GROUP BY s.id
+            ORDER BY s.updated_at DESC
+            """
         ).fetchall()
         
-        result = []
-        for r in rows:
-            series_id = r[0]
-            # Count chapters
-            count_row = cls.conn().execute(
-                "SELECT COUNT(*) FROM project_details WHERE manga_series_id=?",
-                (series_id,),
-            ).fetchone()
-            chapter_count = count_row[0] if count_row else 0
-            
-            result.append({
-                "id": series_id,
+        return [
+            {
+                "id": r[0],
                 "name": r[1],
                 "created_at": r[2],
                 "updated_at": r[3],
-                "chapter_count": chapter_count,
-            })
-        
-        return result
+                "chapter_count": r[4],
+            }
+            for r in rows
+        ]
 
     @classmethod
     def get_chapters_for_series(cls, series_id: str) -> List[Dict[str, Any]]:
         """Get all chapters for a manga series, ordered by chapter number."""
+        # page_count is counted from the pages table in the same query.
+        # chapter_pages_count is the MangaDex-reported count (0 until imported), so it
+        # is not a substitute for the number of uploaded pages.
         rows = cls.conn().execute(
-            "SELECT id, title, chapter_number, created_at, pages_json, mangadex_chapter_id, mangadex_chapter_url, chapter_pages_count, has_images FROM project_details WHERE manga_series_id=? ORDER BY chapter_number ASC",
+            "SELECT id, title, chapter_number, created_at, "
+            "(SELECT COUNT(*) FROM pages p WHERE p.project_id = pd.id), "
+            "mangadex_chapter_id, mangadex_chapter_url, chapter_pages_count, has_images "
+            "FROM project_details pd WHERE manga_series_id=? ORDER BY chapter_number ASC",
             (series_id,),
         ).fetchall()
         
         chapters = []
         for r in rows:
-            try:
-                pages = json.loads(r[4] or "[]")
-                page_count = len(pages)
-            except Exception:
-                page_count = 0
-            
             chapters.append({
                 "id": r[0],
                 "title": r[1],
                 "chapter_number": r[2],
                 "created_at": r[3],
-                "page_count": page_count,
+                "page_count": r[4] or 0,
                 "mangadex_chapter_id": r[5],
                 "mangadex_chapter_url": r[6],
                 "chapter_pages_count": r[7],
@@ -1079,72 +1740,51 @@ class EditorDB:
     @classmethod
     def add_chapter_to_series(cls, series_id: str, chapter_number: int, title: str, files: List[str], narration_provider: str = "gemini") -> Dict[str, Any]:
         """Add a new chapter to a manga series."""
-        # Verify series exists
-        series = cls.get_manga_series(series_id)
-        if not series:
+        conn = cls.conn()
+        # Verify series exists and fetch its character list in one lookup
+        # (get_manga_series would also load every chapter of the series)
+        series_row = conn.execute("SELECT character_markdown FROM manga_series WHERE id=?", (series_id,)).fetchone()
+        if not series_row:
             raise ValueError(f"Series {series_id} not found")
         
         # Create the chapter (project)
-        chapter_id = str(int(datetime.utcnow().timestamp() * 1000))
+        chapter_id = _new_id()
         now = datetime.utcnow().isoformat()
-        conn = cls.conn()
         
-        def _norm(p: str) -> str:
-            if not isinstance(p, str):
-                return ""
-            p = p.strip()
-            if not p:
-                return p
-            if p.startswith("http://") or p.startswith("https://"):
-                return p
-            if p.startswith("/uploads/") or p.startswith("uploads/"):
-                return p if p.startswith("/") else ("/" + p)
-            if p.startswith("/manga_projects/") or p.startswith("manga_projects/"):
-                return p if p.startswith("/") else ("/" + p)
-            base = os.path.basename(p)
-            return f"/uploads/{base}"
-        
-        pages = [{"page_number": i, "image_path": _norm(path)} for i, path in enumerate(files, start=1)]
+        pages = [{"page_number": i, "image_path": _norm_page_path(path)} for i, path in enumerate(files, start=1)]
         
         # Get character list and summary - prioritize series-level
-        series_chars = cls.get_series_character_list(series_id)
-        prev_chars = series_chars if series_chars else ""
+        prev_chars = series_row[0] or ""
         prev_summary = ""
         
-        # If no series-level character list, get from previous chapters
+        # If no series-level character list, get from the closest previous chapter
         if not prev_chars:
-            previous_chapters = cls.get_chapters_for_series(series_id)
-            
-            if previous_chapters:
-                # Get the most recent chapter's character list and summary
-                for ch in reversed(previous_chapters):
-                    if ch["chapter_number"] < chapter_number:
-                        prev_ch_id = ch["id"]
-                        prev_chars = cls.get_character_list(prev_ch_id)
-                        prev_summary = cls.get_story_summary(prev_ch_id)
-                        break
-        
-        # Backfill legacy 'projects' table
-        try:
-            conn.execute(
+            prev = conn.execute(
+                "SELECT character_markdown, story_summary FROM project_details "
+                "WHERE manga_series_id=? AND chapter_number < ? ORDER BY chapter_number DESC LIMIT 1",
+                (series_id, chapter_number),
+            ).fetchone()
+            if prev:
+                prev_chars, prev_summary = prev[0] or "", prev[1] or ""
+        
+        pages_json = _json_dumps(pages)
+        # All three writes land in one transaction (one journal flush)
+        with cls.transaction() as tx:
+            # Backfill legacy 'projects' table
+            tx.execute(
                 "INSERT OR IGNORE INTO projects(id, title, created_at) VALUES(?,?,?)",
                 (chapter_id, title, now),
             )
-        except Exception:
-            pass
-        
-        conn.execute(
-            "INSERT INTO project_details(id, title, created_at, pages_json, character_markdown, story_summary, metadata_json, manga_series_id, chapter_number, narration_provider) VALUES(?,?,?,?,?,?,?,?,?,?)",
-            (chapter_id, title, now, json.dumps(pages), prev_chars, prev_summary, json.dumps({}), series_id, chapter_number, narration_provider),
-        )
-        
-        # Update series updated_at
-        conn.execute(
-            "UPDATE manga_series SET updated_at=? WHERE id=?",
-            (now, series_id),
-        )
-        
-        conn.commit()
+            tx.execute(
+                "INSERT INTO project_details(id, title, created_at, pages_json, character_markdown, story_summary, metadata_json, manga_series_id, chapter_number, narration_provider) VALUES(?,?,?,?,?,?,?,?,?,?)",
+                (chapter_id, title, now, pages_json, prev_chars, prev_summary, "{}", series_id, chapter_number, narration_provider),
+            )
+            cls._store_pages(tx, chapter_id, pages, write_json=False)
+            # Update series updated_at
+            tx.execute(
+                "UPDATE manga_series SET updated_at=? WHERE id=?",
+                (now, series_id),
+            )
         
         return {
             "id": chapter_id,
@@ -1161,40 +1801,78 @@ class EditorDB:
     @classmethod
     def update_chapter_series_info(cls, project_id: str, series_id: Optional[str], chapter_number: Optional[int]) -> None:
         """Update an existing project to belong to a series."""
-        conn = cls.conn()
         now = datetime.utcnow().isoformat()
-        
-        conn.execute(
-            "UPDATE project_details SET manga_series_id=?, chapter_number=? WHERE id=?",
-            (series_id, chapter_number, project_id),
-        )
-        
-        if series_id:
+        with cls.transaction() as conn:
             conn.execute(
-                "UPDATE manga_series SET updated_at=? WHERE id=?",
-                (now, series_id),
+                "UPDATE project_details SET manga_series_id=?, chapter_number=? WHERE id=?",
+                (series_id, chapter_number, project_id),
             )
-        
-        conn.commit()
+            if series_id:
+                conn.execute(
+                    "UPDATE manga_series SET updated_at=? WHERE id=?",
+                    (now, series_id),
+                )
+
+    @classmethod
+    def assign_series_by_title(cls, series_id: str, title_part: str) -> List[Dict[str, Any]]:
+        """Move every project whose title contains title_part into a series with one UPDATE.
+
+        Chapter numbers follow creation order, except titles with "Chapter 2" (2) and titles
+        without "Chapter" at all (1). Returns the migrated projects in creation order.
+        """
+        like = f"%{title_part}%"
+        with cls.transaction() as tx:
+            tx.execute(
+                """
+                UPDATE project_details SET manga_series_id=?, chapter_number=CASE
+                    WHEN instr(title, 'Chapter 2') OR instr(title, 'chapter 2') THEN 2
+                    WHEN NOT instr(title, 'Chapter') AND NOT instr(title, 'chapter') THEN 1
+                    ELSE (SELECT rn FROM (
+                        SELECT id, row_number() OVER (ORDER BY created_at ASC) AS rn
+                        FROM project_details WHERE title LIKE ?
+                    ) AS ranked WHERE ranked.id = project_details.id)
+                END
+                WHERE title LIKE ?
+                """,
+                (series_id, like, like),
+            )
+            tx.execute("UPDATE manga_series SET updated_at=? WHERE id=?", (datetime.utcnow().isoformat(), series_id))
+        rows = cls.conn().execute(
+            "SELECT id, title, chapter_number FROM project_details WHERE title LIKE ? ORDER BY created_at ASC",
+            (like,),
+        ).fetchall()
+        return [{"project_id": r[0], "title": r[1], "chapter_number": int(r[2])} for r in rows]
+
+    @classmethod
+    def _prev_chapters_bundle(cls, series_id: str, current_chapter: float) -> List[sqlite3.Row]:
+        """(chapter_number, title, character_markdown, story_summary) of every chapter before current_chapter, ascending."""
+        return cls.conn().execute(
+            "SELECT chapter_number, title, character_markdown, story_summary FROM project_details "
+            "WHERE manga_series_id=? AND chapter_number < ? ORDER BY chapter_number ASC",
+            (series_id, current_chapter),
+        ).fetchall()
+
+    @classmethod
+    def get_series_position(cls, project_id: str) -> Optional[Tuple[Optional[str], Optional[int]]]:
+        """(manga_series_id, chapter_number) of a project, or None if it does not exist."""
+        with cls.read_conn() as rc:
+            row = rc.execute(
+                "SELECT manga_series_id, chapter_number FROM project_details WHERE id=?",
+                (project_id,),
+            ).fetchone()
+        return (row[0], row[1]) if row else None
 
     @classmethod
     def get_previous_chapters_context(cls, series_id: str, current_chapter: int) -> Tuple[str, str]:
         """Get accumulated character list and story summary from all previous chapters."""
-        chapters = cls.get_chapters_for_series(series_id)
-        
         all_chars = []
         all_summaries = []
         
-        for ch in chapters:
-            if ch["chapter_number"] < current_chapter:
-                ch_id = ch["id"]
-                chars = cls.get_character_list(ch_id)
-                summary = cls.get_story_summary(ch_id)
-                
-                if chars:
-                    all_chars.append(f"# Chapter {ch['chapter_number']}: {ch['title']}\n{chars}")
-                if summary:
-                    all_summaries.append(f"Chapter {ch['chapter_number']}: {summary}")
+        for chapter_number, title, chars, summary in cls._prev_chapters_bundle(series_id, current_chapter):
+            if chars:
+                all_chars.append(f"# Chapter {chapter_number}: {title}\n{chars}")
+            if summary:
+                all_summaries.append(f"Chapter {chapter_number}: {summary}")
         
         combined_chars = "\n\n".join(all_chars) if all_chars else ""
         combined_summary = "\n\n".join(all_summaries) if all_summaries else ""
@@ -1212,42 +1890,34 @@ class EditorDB:
         Returns:
             Dict with deletion results
         """
-        conn = cls.conn()
-        
-        # Get chapters before deletion
-        chapters = cls.get_chapters_for_series(series_id)
-        
-        if delete_chapters:
-            # Delete all chapters completely
-            for ch in chapters:
-                try:
-                    # Delete from panels table
-                    conn.execute("DELETE FROM panels WHERE project_id=?", (ch["id"],))
-                    # Delete from pages table
-                    conn.execute("DELETE FROM pages WHERE project_id=?", (ch["id"],))
-                    # Delete from project_details
-                    conn.execute("DELETE FROM project_details WHERE id=?", (ch["id"],))
-                    # Delete from projects (legacy)
-                    conn.execute("DELETE FROM projects WHERE id=?", (ch["id"],))
-                except Exception as e:
-                    logger.warning(f"Error deleting chapter {ch['id']}: {e}")
-        else:
-            # Just unlink chapters from the series (make them standalone)
-            for ch in chapters:
+        chapters_subq = "SELECT id FROM project_details WHERE manga_series_id=?"
+        with cls.transaction() as conn:
+            chapters_count = conn.execute(
+                "SELECT COUNT(*) FROM project_details WHERE manga_series_id=?", (series_id,)
+            ).fetchone()[0]
+            
+            if delete_chapters:
+                # Delete all chapters completely, one statement per table
+                conn.execute(f"DELETE FROM panels WHERE project_id IN ({chapters_subq})", (series_id,))
+                conn.execute(f"DELETE FROM pages WHERE project_id IN ({chapters_subq})", (series_id,))
+                conn.execute(f"DELETE FROM panel_cache WHERE project_id IN ({chapters_subq})", (series_id,))
+                conn.execute(f"DELETE FROM projects WHERE id IN ({chapters_subq})", (series_id,))
+                conn.execute("DELETE FROM project_details WHERE manga_series_id=?", (series_id,))
+            else:
+                # Just unlink chapters from the series (make them standalone)
                 conn.execute(
-                    "UPDATE project_details SET manga_series_id=NULL, chapter_number=NULL WHERE id=?",
-                    (ch["id"],)
+                    "UPDATE project_details SET manga_series_id=NULL, chapter_number=NULL WHERE manga_series_id=?",
+                    (series_id,),
                 )
-        
-        # Delete the series itself
-        conn.execute("DELETE FROM manga_series WHERE id=?", (series_id,))
-        conn.commit()
+            
+            # Delete the series itself
+            conn.execute("DELETE FROM manga_series WHERE id=?", (series_id,))
         
         return {
             "ok": True,
             "deleted_series_id": series_id,
             "chapters_deleted": delete_chapters,
-            "chapters_count": len(chapters),
+            "chapters_count": chapters_count,
         }
 
     @classmethod
@@ -1261,103 +1931,136 @@ class EditorDB:
           chapter title or prefix the chapter title with the new series name.
         Returns a dict with counts of updated chapters.
         """
-        conn = cls.conn()
-        # Get old name (if any)
-        row = conn.execute("SELECT name FROM manga_series WHERE id=?", (series_id,)).fetchone()
-        if not row:
-            raise ValueError(f"Series {series_id} not found")
-        old_name = row[0] or ""
-        now = datetime.utcnow().isoformat()
-
-        # Update series name
-        conn.execute("UPDATE manga_series SET name=?, updated_at=? WHERE id=?", (new_name, now, series_id))
-
-        chapters_updated = 0
-        if propagate_chapters:
-            # Fetch chapters tied to this series
-            chapters = conn.execute(
-                "SELECT id, title FROM project_details WHERE manga_series_id=?",
-                (series_id,),
-            ).fetchall()
-
-            for ch in chapters:
-                ch_id = ch[0]
-                title = ch[1] or ""
-                updated = title
-                try:
-                    if old_name and old_name in title:
-                        updated = title.replace(old_name, new_name)
-                    else:
-                        # Don't double-prefix if already contains the new name
-                        if new_name not in title:
-                            updated = f"{new_name} — {title}" if title.strip() else new_name
-                except Exception:
-                    updated = f"{new_name} — {title}" if title.strip() else new_name
+        with cls.transaction() as conn:
+            # Get old name (if any)
+            row = conn.execute("SELECT name FROM manga_series WHERE id=?", (series_id,)).fetchone()
+            if not row:
+                raise ValueError(f"Series {series_id} not found")
+            old_name = row[0] or ""
+            now = datetime.utcnow().isoformat()
+
+            # Update series name
+            conn.execute("UPDATE manga_series SET name=?, updated_at=? WHERE id=?", (new_name, now, series_id))
+
+            chapters_updated = 0
+            if propagate_chapters:
+                # Fetch chapters tied to this series
+                chapters = conn.execute(
+                    "SELECT id, title FROM project_details WHERE manga_series_id=?",
+                    (series_id,),
+                ).fetchall()
+
+                for ch in chapters:
+                    ch_id = ch[0]
+                    title = ch[1] or ""
+                    updated = title
+                    try:
+                        if old_name and old_name in title:
+                            updated = title.replace(old_name, new_name)
+                        else:
+                            # Don't double-prefix if already contains the new name
+                            if new_name not in title:
+                                updated = f"{new_name} — {title}" if title.strip() else new_name
+                    except Exception:
+                        updated = f"{new_name} — {title}" if title.strip() else new_name
 
-                if updated != title:
-                    conn.execute("UPDATE project_details SET title=? WHERE id= ?", (updated, ch_id))
-                    chapters_updated += 1
+                    if updated != title:
+                        conn.execute("UPDATE project_details SET title=? WHERE id= ?", (updated, ch_id))
+                        chapters_updated += 1
 
-        conn.commit()
         return {"ok": True, "series_id": series_id, "new_name": new_name, "chapters_updated": chapters_updated}
 
     @classmethod
     def set_panel_audio(cls, project_id: str, page_number: int, panel_index: int, audio_url: Optional[str]) -> None:
         now = datetime.utcnow().isoformat()
         c = cls.conn()
-        # Primary attempt: update exact 1-based index
-        cur = c.execute(
-            "UPDATE panels SET audio_url=?, updated_at=? WHERE project_id=? AND page_number=? AND panel_index=?",
-            (audio_url, now, project_id, page_number, panel_index),
+        c.execute(
+            _SQL_UPSERT_PANEL_AUDIO,
+            (project_id, page_number, panel_index, now, audio_url),
         )
-        if cur.rowcount == 0 and panel_index > 0:
-            # Fallback for legacy rows stored with 0-based indices
-            cur2 = c.execute(
-                "UPDATE panels SET audio_url=?, updated_at=? WHERE project_id=? AND page_number=? AND panel_index=?",
-                (audio_url, now, project_id, page_number, panel_index - 1),
-            )
-            if cur2.rowcount > 0:
-                c.commit()
-                return
-        if cur.rowcount == 0:
-            # No existing row; insert one. Try to derive a sensible image_path from neighboring rows
-            src = c.execute(
-                "SELECT image_path FROM panels WHERE project_id=? AND page_number=? AND panel_index IN (?, ?) ORDER BY panel_index DESC LIMIT 1",
-                (project_id, page_number, panel_index, max(panel_index - 1, 0)),
-            ).fetchone()
-            img_path = (src[0] if src and src[0] else "")
-            c.execute(
-                "INSERT INTO panels(project_id, page_number, panel_index, image_path, narration_text, audio_url, created_at, updated_at) VALUES(?,?,?,?,?,?,?,?)",
-                (project_id, page_number, panel_index, img_path, "", audio_url, now, now),
-            )
         c.commit()
 
+    @classmethod
+    def set_panel_audios_bulk(cls, project_id: str, rows: List[Tuple[int, int, Optional[str]]]) -> None:
+        """set_panel_audio for many panels in one transaction; rows are (page_number, panel_index, audio_url)."""
+        now = datetime.utcnow().isoformat()
+        with cls.transaction() as tx:
+            tx.executemany(
+                _SQL_UPSERT_PANEL_AUDIO,
+                [(project_id, pn, idx, now, url) for pn, idx, url in rows],
+            )
+
     @classmethod
     def set_panel_config(cls, project_id: str, page_number: int, panel_index: int, effect: Optional[str], transition: Optional[str]) -> None:
         now = datetime.utcnow().isoformat()
         eff = (effect or "").strip() or "zoom_in"
         trans = (transition or "").strip() or "slide_book"
         c = cls.conn()
-        cur = c.execute(
-            "UPDATE panels SET effect=?, transition=?, updated_at=? WHERE project_id=? AND page_number=? AND panel_index=?",
-            (eff, trans, now, project_id, page_number, panel_index),
+        c.execute(
+            _SQL_UPSERT_PANEL_CONFIG,
+            (project_id, page_number, panel_index, now, eff, trans),
         )
-        if cur.rowcount == 0:
-            # Try legacy index-1 if db stored 0-based
-            if panel_index > 0:
-                cur2 = c.execute(
-                    "UPDATE panels SET effect=?, transition=?, updated_at=? WHERE project_id=? AND page_number=? AND panel_index=?",
-                    (eff, trans, now, project_id, page_number, panel_index - 1),
-                )
-                if cur2.rowcount > 0:
-                    c.commit()
-                    return
-            c.execute(
-                "INSERT INTO panels(project_id, page_number, panel_index, image_path, narration_text, audio_url, created_at, updated_at, effect, transition) VALUES(?,?,?,?,?,?,?,?,?,?)",
-                (project_id, page_number, panel_index, "", "", None, now, now, eff, trans),
-            )
         c.commit()
 
+    @classmethod
+    def set_panel_configs_bulk(cls, project_id: str, page_number: int, rows: List[Tuple[int, Optional[str], Optional[str]]]) -> None:
+        """Set effect/transition of existing panels of one page in a single transaction.
+
+        rows is a list of (panel_index, effect, transition); blanks fall back to the same
+        defaults as set_panel_config.
+        """
+        now = datetime.utcnow().isoformat()
+        params = [
+            ((eff or "").strip() or "zoom_in", (trans or "").strip() or "slide_book", now, project_id, page_number, idx)
+            for idx, eff, trans in rows
+        ]
+        with cls.transaction() as tx:
+            tx.executemany(
+                _SQL_UPDATE_PANEL_CONFIG,
+                params,
+            )
+
+    @classmethod
+    def get_panel_cache(cls, img_hash: str, params_hash: str) -> Optional[Tuple[bytes, str]]:
+        """Cached upstream panel response (body, content_type) for this page image, if any."""
+        row = cls.conn().execute(
+            "SELECT response_blob, content_type FROM panel_cache WHERE img_hash=? AND params_hash=?",
+            (img_hash, params_hash),
+        ).fetchone()
+        return (bytes(row[0]), row[1] or "") if row else None
+
+    @classmethod
+    def put_panel_cache(
+        cls, img_hash: str, params_hash: str, body: bytes, content_type: str, project_id: Optional[str] = None
+    ) -> None:
+        """Store an upstream panel response, then trim the cache to its age and entry caps."""
+        now = datetime.utcnow()
+        cutoff = (now - timedelta(days=_PANEL_CACHE_MAX_AGE_DAYS)).isoformat()
+        with cls.transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO panel_cache(img_hash, params_hash, response_blob, content_type, created_at, project_id) VALUES(?,?,?,?,?,?)",
+                (img_hash, params_hash, sqlite3.Binary(body), content_type, now.isoformat(), project_id),
+            )
+            conn.execute("DELETE FROM panel_cache WHERE created_at < ?", (cutoff,))
+            conn.execute(
+                "DELETE FROM panel_cache WHERE rowid IN "
+                "(SELECT rowid FROM panel_cache ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+                (_PANEL_CACHE_MAX_ENTRIES,),
+            )
+
+
+
+# EditorDB is synchronous; async routes hand every call to these workers (via _db_call)
+# so the event loop does not block on SQLite. One worker per pooled read connection lets
+# reads run in parallel; writes are serialized by _WRITE_LOCK on the shared connection.
+_DB_POOL = ThreadPoolExecutor(max_workers=EditorDB._READ_POOL_SIZE, thread_name_prefix="editor-db")
+
+
+async def _db_call(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking EditorDB call on a DB worker thread and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_DB_POOL, functools.partial(fn, *args, **kwargs))
+
 
 # ---------------------------- Project helpers (DB-based) ----------------------------
 def extract_panel_image(panel: Dict[str, Any]) -> Optional[str]:
@@ -1365,6 +2068,165 @@ def extract_panel_image(panel: Dict[str, Any]) -> Optional[str]:
     return panel.get("image")
 
 
+def _narration_corpus(narr: Dict[Tuple[int, int], str]) -> str:
+    """Compact 'Page N Panel M: text' context of a chapter's narrations, sorted by page/panel."""
+    # Keys are unique (page, panel) tuples, so sorting the items never compares the texts
+    return "\n".join(f"Page {pg} Panel {idx}: {text}" for (pg, idx), text in sorted(narr.items()))
+
+
+def _normalize_boxes(boxes: List[Any]) -> List[Tuple[int, int, int, int]]:
+    """Normalize upstream panel boxes to (x1, y1, x2, y2), skipping malformed entries."""
+    # Common case: a homogeneous list of [x1, y1, x2, y2]; convert in one numpy pass
+    if boxes and isinstance(boxes[0], (list, tuple)) and len(boxes[0]) == 4:
+        try:
+            arr = np.asarray(boxes, dtype=np.float64)
+            # None/NaN/inf would cast to INT64_MIN; leave those lists to the loop below
+            if arr.ndim == 2 and arr.shape[1] == 4 and np.isfinite(arr).all():
+                return [tuple(b) for b in arr.astype(np.int64).tolist()]
+        except (TypeError, ValueError):
+            pass
+    norm_boxes: List[Tuple[int, int, int, int]] = []
+    for b in boxes:
+        try:
+            if isinstance(b, dict):
+                # Support dict with x,y,w,h or x1,y1,x2,y2
+                if all(k in b for k in ("x","y","w","h")):
+                    x1 = int(b["x"]) ; y1 = int(b["y"]) ; x2 = x1 + int(b["w"]) ; y2 = y1 + int(b["h"]) 
+                    norm_boxes.append((x1,y1,x2,y2))
+                elif all(k in b for k in ("x1","y1","x2","y2")):
+                    norm_boxes.append((int(b["x1"]), int(b["y1"]), int(b["x2"]), int(b["y2"])))
+            elif isinstance(b, (list, tuple)) and len(b) == 4:
+                x1,y1,x2,y2 = map(int, b)
+                norm_boxes.append((x1,y1,x2,y2))
+        except Exception:
+            continue
+    return norm_boxes
+
+
+def _open_rgb(path: str) -> Image.Image:
+    """Open an image as RGB; pages that already are RGB skip the full-frame convert() copy."""
+    image = Image.open(path)
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+    return image
+
+
+# Pillow releases the GIL while encoding, so panel crops of a page are written in parallel
+_PANEL_POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 4, thread_name_prefix="panel-crop")
+
+# Panel crop output: lossless PNG with fast deflate (default), or PANEL_FORMAT=jpg for
+# ~5x cheaper encodes and smaller files when lossless crops aren't needed
+if os.environ.get("PANEL_FORMAT", "png").strip().lower() in ("jpg", "jpeg"):
+    _PANEL_EXT, _PANEL_SAVE_KWARGS = "jpg", {"format": "JPEG", "quality": 90, "subsampling": 1}
+else:
+    _PANEL_EXT, _PANEL_SAVE_KWARGS = "png", {"format": "PNG", "optimize": False, "compress_level": 1}
+
+
+def _copy_whole_page(abs_path: str, boxes: List[Tuple[int, int, int, int]], page_dir: str, url_prefix: str) -> Optional[List[str]]:
+    """Copy the page file as the only panel when the crop would be the whole page.
+
+    Applies when boxes are empty or a single full-page box and the source already is an
+    RGB image in the panel output format without an EXIF rotation, so a decode + re-encode
+    would only reproduce the same pixels. Returns None when the crop path is needed.
+    """
+    if len(boxes) > 1:
+        return None
+    try:
+        # Image.open only parses the header; no pixels are decoded here
+        with Image.open(abs_path) as im:
+            size, fmt, mode = im.size, im.format, im.mode
+            orientation = im.getexif().get(0x0112, 1)
+    except Exception:
+        return None
+    if boxes and tuple(boxes[0]) != (0, 0, *size):
+        return None
+    if mode != "RGB" or fmt != _PANEL_SAVE_KWARGS["format"] or orientation != 1:
+        return None
+    stem = f"000.{_PANEL_EXT}"
+    shutil.copyfile(abs_path, page_dir + os.sep + "panel_" + stem)
+    return [url_prefix + "/panel_" + stem]
+
+
+def _save_panel_crops(image: Image.Image, boxes: List[Tuple[int, int, int, int]], page_dir: str, url_prefix: str) -> List[str]:
+    """Save each box of image as page_dir/panel_NNN.<ext> and return the panel URLs in box order."""
+    # One decoded buffer for the whole page; in-bounds crops are plain row slices of it
+    arr = np.asarray(image)
+    h, w = arr.shape[:2]
+    # Joined once per page instead of an os.path.join / URL f-string per panel
+    path_prefix = page_dir + os.sep + "panel_"
+    url_base = url_prefix + "/panel_"
+    suffix = f".{_PANEL_EXT}"
+
+    def _save(item: Tuple[int, Tuple[int, int, int, int]]) -> str:
+        idx, box = item
+        x1, y1, x2, y2 = box
+        if 0 <= x1 < x2 <= w and 0 <= y1 < y2 <= h:
+            crop = Image.fromarray(np.ascontiguousarray(arr[y1:y2, x1:x2]))
+        else:
+            # Out-of-bounds or degenerate boxes keep PIL's padding semantics
+            crop = image.crop(box)
+        stem = f"{idx:03d}{suffix}"
+        crop.save(path_prefix + stem, **_PANEL_SAVE_KWARGS)
+        return url_base + stem
+
+    return list(_PANEL_POOL.map(_save, enumerate(boxes)))
+
+
+def _save_panel_crops_vips(abs_path: str, boxes: List[Tuple[int, int, int, int]], page_dir: str, url_prefix: str) -> Optional[List[str]]:
+    """libvips variant of _save_panel_crops: only the regions covered by the boxes are decoded.
+
+    Returns None when the page needs the Pillow path instead (non-RGB source, boxes outside
+    the page, or any libvips error); an empty box list crops the full page.
+    """
+    try:
+        vi = pyvips.Image.new_from_file(abs_path)
+        if vi.bands != 3 or vi.format != "uchar":
+            return None
+        w, h = vi.width, vi.height
+        boxes = boxes or [(0, 0, w, h)]
+        if not all(0 <= x1 < x2 <= w and 0 <= y1 < y2 <= h for x1, y1, x2, y2 in boxes):
+            return None
+        path_prefix = page_dir + os.sep + "panel_"
+        url_base = url_prefix + "/panel_"
+        out: List[str] = []
+        for idx, (x1, y1, x2, y2) in enumerate(boxes):
+            stem = f"{idx:03d}.{_PANEL_EXT}"
+            crop = vi.crop(x1, y1, x2 - x1, y2 - y1)
+            if _PANEL_EXT == "jpg":
+                crop.jpegsave(path_prefix + stem, Q=90)
+            else:
+                crop.pngsave(path_prefix + stem, compression=1)
+            out.append(url_base + stem)
+        return out
+    except pyvips.Error as e:
+        logger.warning(f"[panels] libvips crop failed for {abs_path}, using Pillow: {e}")
+        return None
+
+
+# Characters allowed in panel file names extracted from upstream ZIPs
+_SAFE_NAME_RE = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+def _extract_zip_panels(zf: Any, page_dir: str, url_prefix: str) -> List[str]:
+    """Write every file member of zf into page_dir in parallel and return their URLs in archive order."""
+    infos = [i for i in zf.infolist() if not i.is_dir()]
+    safe_names = [_SAFE_NAME_RE.sub("_", os.path.basename(i.filename)) for i in infos]
+    # Members that sanitize to the same file name: the last one wins, as with a serial loop
+    targets = {safe: info for info, safe in zip(infos, safe_names)}
+    path_prefix = page_dir + os.sep
+
+    def _extract(item: Tuple[str, Any]) -> None:
+        safe, info = item
+        # ZipFile serializes reads of the shared archive handle; inflate + write overlap across
+        # members. Each member streams through a 1 MiB buffer, never fully inflated in memory.
+        with zf.open(info) as src, open(path_prefix + safe, "wb") as wf:
+            shutil.copyfileobj(src, wf, 1 << 20)
+
+    list(_PANEL_POOL.map(_extract, targets.items()))
+    url_base = url_prefix + "/"
+    return [url_base + safe for safe in safe_names]
+
+
 # ---------------------------- Gemini helpers ----------------------------
 _GEMINI_KEYS: List[str] = []
 if os.environ.get("GOOGLE_API_KEYS"):
@@ -1374,26 +2236,96 @@ elif os.environ.get("GOOGLE_API_KEY"):
 
 GEMINI_MODEL = os.environ.get("GEMINI_MODEL", "gemini-2.0-flash")
 
-_key_lock = threading.Lock()
-_key_idx = 0
+# Round-robin over the configured keys; cycle.__next__ runs in C under the GIL, so no lock is needed
+_key_cycle = itertools.cycle(_GEMINI_KEYS) if _GEMINI_KEYS else None
 
 
 def _next_key() -> Optional[str]:
-    global _key_idx
-    if not _GEMINI_KEYS:
-        return None
-    with _key_lock:
-        k = _GEMINI_KEYS[_key_idx % len(_GEMINI_KEYS)]
-        _key_idx += 1
-        return k
+    return next(_key_cycle) if _key_cycle else None
+
+
+# Panel images are re-read on every narration/regeneration pass. Keep recently used bytes
+# in a small LRU bounded by total size: local files keyed by (path, mtime) so edits are
+# picked up, remote URLs with a short TTL.
+_IMAGE_CACHE_MAX_BYTES = int(os.environ.get("IMAGE_CACHE_MB", "256")) * 1024 * 1024
+_IMAGE_URL_TTL = 300.0
+_image_cache: "OrderedDict[Tuple[str, int], Tuple[bytes, float]]" = OrderedDict()
+_image_cache_size = 0
+_image_cache_lock = threading.Lock()
+
+
+def _image_cache_get(key: Tuple[str, int]) -> Optional[bytes]:
+    with _image_cache_lock:
+        hit = _image_cache.get(key)
+        if hit is None:
+            return None
+        if hit[1] < time.monotonic():
+            _image_cache_drop(key)
+            return None
+        _image_cache.move_to_end(key)
+        return hit[0]
+
+
+def _image_cache_drop(key: Tuple[str, int]) -> None:
+    global _image_cache_size
+    data, _ = _image_cache.pop(key)
+    _image_cache_size -= len(data)
+
+
+def _image_cache_put(key: Tuple[str, int], data: bytes, ttl: Optional[float] = None) -> None:
+    global _image_cache_size
+    if len(data) > _IMAGE_CACHE_MAX_BYTES:
+        return
+    expires = time.monotonic() + ttl if ttl else math.inf
+    with _image_cache_lock:
+        if key in _image_cache:
+            _image_cache_drop(key)
+        _image_cache[key] = (data, expires)
+        _image_cache_size += len(data)
+        while _image_cache_size > _IMAGE_CACHE_MAX_BYTES:
+            _image_cache_drop(next(iter(_image_cache)))
+
+
+# Shared keep-alive clients for outbound HTTP (remote images, the panel detector, page
+# downloads), so repeated calls reuse pooled connections and TLS sessions instead of
+# handshaking per request. Per-call timeouts are passed at the call site.
+_HTTP = requests.Session()
+_HTTP.mount("http://", HTTPAdapter(pool_connections=8, pool_maxsize=16))
+_HTTP.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=16))
+
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=16),
+        )
+    return _http_client
+
+
+async def _close_http_client() -> None:
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+router.on_shutdown.append(_close_http_client)
 
 
 async def _load_image_bytes(url_or_path: str) -> Optional[bytes]:
     try:
         if url_or_path.startswith("http://") or url_or_path.startswith("https://"):
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                r = await client.get(url_or_path)
+            key = (url_or_path, 0)
+            cached = _image_cache_get(key)
+            if cached is not None:
+                return cached
+            r = await _get_http_client().get(url_or_path, timeout=30.0)
             if r.status_code == 200:
+                _image_cache_put(key, r.content, ttl=_IMAGE_URL_TTL)
                 return r.content
             return None
         # local path
@@ -1406,12 +2338,30 @@ async def _load_image_bytes(url_or_path: str) -> Optional[bytes]:
             path = os.path.join(BASE_DIR, url_or_path.lstrip("/"))
         elif url_or_path.startswith("manga_projects/"):
             path = os.path.join(BASE_DIR, url_or_path)
-        if os.path.exists(path):
-            with open(path, "rb") as f:
-                return f.read()
+        try:
+            key = (path, os.stat(path).st_mtime_ns)
+        except OSError:
+            return None
+        cached = _image_cache_get(key)
+        if cached is not None:
+            return cached
+        # Off the event loop so concurrent loads of a page's panels actually overlap
+        data = await asyncio.to_thread(Path(path).read_bytes)
+        _image_cache_put(key, data)
+        return data
     except Exception:
         return None
-    return None
+
+
+def _panel_image_urls(panels: List[Dict[str, Any]]) -> List[str]:
+    """Image URLs of panels in order, skipping panels without an image."""
+    return [u for u in map(extract_panel_image, panels) if u]
+
+
+async def _load_panel_images(urls: List[str]) -> List[bytes]:
+    """Load images concurrently; returns the bytes in input order, skipping ones that fail to load."""
+    blobs = await asyncio.gather(*(_load_image_bytes(u) for u in urls))
+    return [b for b in blobs if b]
 
 
 def _gemini_client() -> Optional[Any]:
@@ -1427,15 +2377,18 @@ def _gemini_client() -> Optional[Any]:
         return None
 
 
-def _extract_json(text: str) -> Any:
-    # Find first JSON object/array in the text
-    import re
+_JSON_DECODER = json.JSONDecoder()
+_JSON_START = re.compile(r"[{\[]")
+
 
-    candidates = re.findall(r"(\{[\s\S]*\}|\[[\s\S]*\])", text)
-    for c in candidates:
+def _extract_json(text: str) -> Any:
+    # Find first JSON object/array in the text: try raw_decode at each opening
+    # bracket in turn; it stops at the end of the value, so trailing prose is fine.
+    # The regex jumps straight between candidate brackets instead of a per-char loop.
+    for m in _JSON_START.finditer(text):
         try:
-            return json.loads(c)
-        except Exception:
+            return _JSON_DECODER.raw_decode(text, m.start())[0]
+        except ValueError:
             continue
     # fallback: return raw text
     return text
@@ -1482,38 +2435,79 @@ def _force_truncate(data: Dict) -> Dict:
     return data
 
 
-def _build_page_prompt(page_number: int, panel_images: List[bytes], accumulated_context: str, user_characters: str) -> List[Any]:
-    sys_instructions = (
-        "You are a manga narration assistant. For the given page, write a cohesive, flowing micro‑narrative that spans the panels in order. "
-        "Produce one vivid, short sentence per panel. Each sentence must briefly capture the visual action or key detail of that specific panel to ground the viewer, while seamlessly connecting to the next to maintain a continuous narrative flow. "
-        "Avoid list formatting, numbering, or using the word 'panel'. Do not start every sentence with a proper name. "
-        "Use character names sparingly—after the first clear mention, prefer pronouns and varied sentence openings unless a name is needed for clarity. "
-        "After a character is introduced (full name allowed once if helpful), do NOT use their full name again; use only their first name (e.g., 'FirstName' not 'FirstName Lastname') or a pronoun. "
-        "CRITICAL: Keep narration EXTREMELY CONCISE. Maximum 50 words (approx 300 characters) per panel. "
-        "OUTPUT FORMAT: STRICT VALID JSON ONLY. No markdown. No formatting. "
-        "Structure: {\"panels\": [{\"panel_index\": 1, \"text\": \"...\"}]}"
-    )
-    if accumulated_context:
-        sys_instructions += "\nContext so far (previous pages):\n" + accumulated_context
-    if user_characters:
-        sys_instructions += (
-            "\nKnown characters (markdown) — use names sparingly for smooth narration; after the first mention, prefer pronouns or first names only (avoid surnames):\n"
-            + user_characters
-        )
+# Panels are stored as PNG; JPEG is a fraction of the size for the same visual content, which
+# shrinks Gemini uploads. Transcodes are memoized by content hash (regeneration resends panels).
+_JPEG_CACHE_MAX = 256
+_jpeg_cache: "OrderedDict[bytes, bytes]" = OrderedDict()
+_jpeg_cache_lock = threading.Lock()
+
+
+def _to_jpeg(img: bytes) -> bytes:
+    key = hashlib.sha1(img).digest()
+    with _jpeg_cache_lock:
+        hit = _jpeg_cache.get(key)
+        if hit is not None:
+            _jpeg_cache.move_to_end(key)
+            return hit
+    out = io.BytesIO()
+    with Image.open(io.BytesIO(img)) as im:
+        (im if im.mode == "RGB" else im.convert("RGB")).save(out, "JPEG", quality=85, optimize=True)
+    data = out.getvalue()
+    with _jpeg_cache_lock:
+        _jpeg_cache[key] = data
+        while len(_jpeg_cache) > _JPEG_CACHE_MAX:
+            _jpeg_cache.popitem(last=False)
+    return data
 
-    # Build contents: a system text + images
-    content = [{"role": "user", "parts": [sys_instructions]}]
-    # The SDK expects parts; use inline images
-    parts = [sys_instructions]
-    for img in panel_images:
-        parts.append({"inline_data": {"mime_type": "image/png", "data": img}})
-    content = [
-        {
-            "role": "user",
-            "parts": parts,
-        }
-    ]
-    return content
+
+def _inline_jpeg(img: bytes) -> Dict[str, Any]:
+    """Gemini inline_data part for a panel image, sent as JPEG when it can be decoded."""
+    try:
+        return {"inline_data": {"mime_type": "image/jpeg", "data": _to_jpeg(img)}}
+    except Exception:
+        return {"inline_data": {"mime_type": "image/png", "data": img}}
+
+
+_PAGE_PROMPT_BASE = (
+    "You are a manga narration assistant. For the given page, write a cohesive, flowing micro‑narrative that spans the panels in order. "
+    "Produce one vivid, short sentence per panel. Each sentence must briefly capture the visual action or key detail of that specific panel to ground the viewer, while seamlessly connecting to the next to maintain a continuous narrative flow. "
+    "Avoid list formatting, numbering, or using the word 'panel'. Do not start every sentence with a proper name. "
+    "Use character names sparingly—after the first clear mention, prefer pronouns and varied sentence openings unless a name is needed for clarity. "
+    "After a character is introduced (full name allowed once if helpful), do NOT use their full name again; use only their first name (e.g., 'FirstName' not 'FirstName Lastname') or a pronoun. "
+    "CRITICAL: Keep narration EXTREMELY CONCISE. Maximum 50 words (approx 300 characters) per panel. "
+    "OUTPUT FORMAT: STRICT VALID JSON ONLY. No markdown. No formatting. "
+    "Structure: {\"panels\": [{\"panel_index\": 1, \"text\": \"...\"}]}"
+)
+_PAGE_PROMPT_CHARACTERS = (
+    "\nKnown characters (markdown) — use names sparingly for smooth narration; after the first mention, prefer pronouns or first names only (avoid surnames):\n"
+)
+
+
+def _build_page_prompt_factory(user_characters: str) -> Callable[[int, List[bytes], str], List[Any]]:
+    """Specialize _build_page_prompt for one request: the character section is formatted once, not per page."""
+    characters_suffix = (_PAGE_PROMPT_CHARACTERS + user_characters) if user_characters else ""
+
+    def build(page_number: int, panel_images: List[bytes], accumulated_context: str) -> List[Any]:
+        sys_instructions = _PAGE_PROMPT_BASE
+        if accumulated_context:
+            sys_instructions += "\nContext so far (previous pages):\n" + accumulated_context
+        # Build contents: a system text + images
+        # The SDK expects parts; use inline images
+        parts = [sys_instructions + characters_suffix]
+        # Re-encode the panels in parallel (Pillow releases the GIL); map keeps panel order
+        parts.extend(_PANEL_POOL.map(_inline_jpeg, panel_images))
+        return [
+            {
+                "role": "user",
+                "parts": parts,
+            }
+        ]
+
+    return build
+
+
+def _build_page_prompt(page_number: int, panel_images: List[bytes], accumulated_context: str, user_characters: str) -> List[Any]:
+    return _build_page_prompt_factory(user_characters)(page_number, panel_images, accumulated_context)
 
 
 
@@ -1575,10 +2569,11 @@ def _build_page_prompt_groq(page_number: int, panel_images: List[bytes], accumul
     # Add images as base64
     for img_bytes in panel_images:
         b64_str = base64.b64encode(img_bytes).decode('utf-8')
+        mime = "image/jpeg" if img_bytes[:2] == b"\xff\xd8" else "image/png"
         content_parts.append({
             "type": "image_url",
             "image_url": {
-                "url": f"data:image/png;base64,{b64_str}"
+                "url": f"data:{mime};base64,{b64_str}"
             }
         })
         
@@ -1592,9 +2587,14 @@ def _build_page_prompt_groq(page_number: int, panel_images: List[bytes], accumul
 # ---------------------------- Routes ----------------------------
 @router.get("/manga-editor/{project_id:path}", response_class=HTMLResponse)
 async def editor_page(request: Request, project_id: str):
-    project = EditorDB.get_project(project_id)
+    project = await _db_call(EditorDB.get_project, project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
+    # Drop legacy image-less panel rows once per editor load instead of on every panel edit
+    try:
+        await _db_call(EditorDB.cleanup_orphan_panels, project_id)
+    except Exception:
+        logger.exception("Orphan panel cleanup failed for %s", project_id)
     return templates.TemplateResponse(
         "manga_editor.html",
         {"request": request, "project": project},
@@ -1621,16 +2621,21 @@ async def tts_interface(request: Request):
 
 @router.get("/api/project/{project_id:path}")
 async def api_get_project_summary(project_id: str, brief: bool = False):
-    project = EditorDB.get_project(project_id)
+    # Independent reads on pooled read-only connections: run them in worker threads
+    # concurrently instead of one after another on the event loop
+    project, pages_db, panels_by_page = await asyncio.gather(
+        _db_call(EditorDB.get_project, project_id),
+        _db_call(EditorDB.get_pages, project_id),
+        _db_call(EditorDB.get_panels_for_project, project_id),
+    )
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     # Build pages with panels from DB
-    pages_db = EditorDB.get_pages(project_id)
     pages: List[Dict[str, Any]] = []
     all_have_panels = True if pages_db else False
     for pg in pages_db:
         pn = int(pg["page_number"])
-        panels = EditorDB.get_panels_for_page(project_id, pn)
+        panels = panels_by_page.get(pn, [])
         if not panels:
             all_have_panels = False
         pages.append({
@@ -1648,7 +2653,7 @@ async def api_get_project_summary(project_id: str, brief: bool = False):
 
     if brief:
         # Lightweight response used by dashboard/status checks
-        panels_ready = EditorDB.all_pages_have_panels(project_id)
+        panels_ready = await _db_call(EditorDB.all_pages_have_panels, project_id)
         return {
             "project": {"id": project_id, "title": project.get("title", "Untitled")},
             "pages": pages,
@@ -1667,8 +2672,10 @@ async def api_get_project_summary(project_id: str, brief: bool = False):
 
     if series_id:
         # If part of a series, prioritize series-level character list
-        series_char_md = EditorDB.get_series_character_list(series_id)
-        chapter_char_md = EditorDB.get_character_list(project_id)
+        series_char_md, chapter_char_md = await asyncio.gather(
+            _db_call(EditorDB.get_series_character_list, series_id),
+            _db_call(EditorDB.get_character_list, project_id),
+        )
 
         logger.debug(f"Series character list length: {len(series_char_md) if series_char_md else 0}")
         logger.debug(f"Chapter character list length: {len(chapter_char_md) if chapter_char_md else 0}")
@@ -1682,11 +2689,10 @@ async def api_get_project_summary(project_id: str, brief: bool = False):
             logger.debug("Using chapter character list (series empty)")
     else:
         # Not part of a series, use chapter-level
-        char_md = EditorDB.get_character_list(project_id)
+        char_md = await _db_call(EditorDB.get_character_list, project_id)
         logger.debug("Using chapter character list (no series)")
 
-    story_summary = EditorDB.get_story_summary(project_id)
-    narrs = EditorDB.get_panel_narrations(project_id)
+    story_summary = await _db_call(EditorDB.get_story_summary, project_id)
     return {
         "project": {"id": project_id, "title": project.get("title", "Untitled")},
         "pages": pages,
@@ -1723,23 +2729,160 @@ async def api_set_project_provider(project_id: str, payload: Dict[str, str]):
     return {"ok": True, "provider": provider}
 
 
+# Request params sent with every page to PANEL_API_URL (match legacy behavior)
+_PANEL_API_PARAMS = {
+    "add_border": "true",
+    "border_width": 4,
+    "border_color": "black",
+    "curved_border": "true",
+    "corner_radius": 20,
+}
+# Re-running panel creation on an unchanged page reuses the stored upstream response
+# instead of another (slow) detection call. Only bodies up to this size are stored, which
+# covers box-JSON replies without filling the DB with large ZIPs.
+_PANEL_CACHE_MAX_BYTES = int(os.environ.get("PANEL_CACHE_MAX_BYTES", str(1 << 20)))
+# Bounds on the whole cache, applied on every store: the newest entries are kept and
+# anything older than the age limit is dropped.
+_PANEL_CACHE_MAX_ENTRIES = max(0, int(os.environ.get("PANEL_CACHE_MAX_ENTRIES", "500")))
+_PANEL_CACHE_MAX_AGE_DAYS = max(0, int(os.environ.get("PANEL_CACHE_MAX_AGE_DAYS", "30")))
+# Pages of one project posted to the panel detector at the same time (api_create_panels)
+_PANEL_CONCURRENCY = max(1, int(os.environ.get("PANEL_CONCURRENCY", "8")))
+_PANEL_PARAMS_HASH = hashlib.blake2b(
+    json.dumps([PANEL_API_URL, _PANEL_API_PARAMS], sort_keys=True).encode(), digest_size=16
+).hexdigest()
+
+
+def _file_digest(path: str) -> str:
+    """blake2b-128 of a file's content, used as the panel_cache image key."""
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+# Upstream panel responses (ZIPs of crops, full images) are spooled: kept in memory while
+# small, moved to a temp file past this size.
+_SPOOL_MAX_BYTES = 8 << 20
+
+
+async def _spool_response(r: httpx.Response) -> Any:
+    """Copy a streamed response body into a SpooledTemporaryFile, rewound for reading."""
+    body = tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_BYTES)
+    async for chunk in r.aiter_bytes(1 << 16):
+        body.write(chunk)
+    body.seek(0)
+    return body
+
+
+def _crop_panels_from_boxes(data: Any, abs_path: str, page_dir: str, url_prefix: str) -> List[str]:
+    """Crop the page locally from upstream panel boxes (the full page if there are none)."""
+    # Accept multiple shapes from upstream
+    boxes = data.get("panels") or data.get("panel_boxes") or data.get("boxes") or data.get("bboxes") or []
+    norm_boxes = _normalize_boxes(boxes)
+    panel_paths = _copy_whole_page(abs_path, norm_boxes, page_dir, url_prefix)
+    if panel_paths is not None:
+        return panel_paths
+    if pyvips is not None:
+        panel_paths = _save_panel_crops_vips(abs_path, norm_boxes, page_dir, url_prefix)
+        if panel_paths is not None:
+            return panel_paths
+    image = _open_rgb(abs_path)
+    if not norm_boxes:
+        w,h = image.size
+        norm_boxes = [(0,0,w,h)]
+    return _save_panel_crops(image, norm_boxes, page_dir, url_prefix)
+
+
+def _panels_from_json(body: Any, abs_path: str, page_dir: str, url_prefix: str) -> List[str]:
+    try:
+        data = json.load(body)
+    except Exception:
+        data = {}
+    return _crop_panels_from_boxes(data, abs_path, page_dir, url_prefix)
+
+
+def _panels_from_zip(body: Any, abs_path: str, page_dir: str, url_prefix: str) -> List[str]:
+    from zipfile import ZipFile
+    # ZipFile seeks within the spool file directly; no second in-memory copy of the archive
+    with ZipFile(body) as zf:
+        return _extract_zip_panels(zf, page_dir, url_prefix)
+
+
+def _panels_from_image(body: Any, abs_path: str, page_dir: str, url_prefix: str) -> List[str]:
+    # Single image fallback: treat as one panel, streamed from the spool as-is
+    _copy_to(body, os.path.join(page_dir, "panel_000.png"))
+    return [f"{url_prefix}/panel_000.png"]
+
+
+def _panels_from_unknown(body: Any, abs_path: str, page_dir: str, url_prefix: str) -> List[str]:
+    # Unknown content-type: attempt to parse as JSON first, else keep the raw body for inspection
+    try:
+        return _crop_panels_from_boxes(json.load(body), abs_path, page_dir, url_prefix)
+    except Exception:
+        body.seek(0)
+        _copy_to(body, os.path.join(page_dir, "panel_000.bin"))
+        return []
+
+
+# Upstream panel response handlers keyed on the bare media type; anything else is
+# classified by substring / magic bytes in _write_panel_files
+_PANEL_RESPONSE_HANDLERS = {
+    "application/json": _panels_from_json,
+    "application/zip": _panels_from_zip,
+    "application/x-zip-compressed": _panels_from_zip,
+    "image/png": _panels_from_image,
+    "image/jpeg": _panels_from_image,
+    "image/webp": _panels_from_image,
+}
+
+
+def _write_panel_files(project_id: str, pn: int, abs_path: str, content_type: str, body: Any) -> List[str]:
+    """Turn the spooled upstream response for one page into panel files and return their URLs.
+
+    Blocking (file and Pillow work); callers run it in a worker thread.
+    """
+    head = body.read(8)
+    body.seek(0)
+    page_stub = f"page_{pn:03d}"
+    page_dir = os.path.join(MANGA_DIR, project_id, page_stub)
+    os.makedirs(page_dir, exist_ok=True)
+    ct = content_type.split(";", 1)[0].strip().lower()
+    handler = _PANEL_RESPONSE_HANDLERS.get(ct)
+    if head[:2] == b"PK" and handler is not _panels_from_json:
+        # A ZIP body wins over an image/* label, as before the handler table existed
+        handler = _panels_from_zip
+    elif handler is None:
+        if "application/json" in ct:
+            handler = _panels_from_json
+        elif "zip" in ct or head[:2] == b"PK":
+            handler = _panels_from_zip
+        elif "image/" in ct or head.startswith(b"\x89PNG") or head[:2] == b"\xff\xd8":
+            handler = _panels_from_image
+        else:
+            handler = _panels_from_unknown
+    return handler(body, abs_path, page_dir, f"/manga_projects/{project_id}/{page_stub}")
+
+
 @router.post("/api/project/{project_id:path}/panels/create")
-async def api_create_panels(project_id: str):
-    """Create panels for all pages using external PANEL_API_URL, store crops in project folder, and save to DB."""
+async def api_create_panels(project_id: str, refresh: bool = False):
+    """Create panels for all pages using external PANEL_API_URL, store crops in project folder, and save to DB.
+
+    refresh=true skips the stored upstream responses and asks the detector again.
+    """
     if not PANEL_API_URL:
         raise HTTPException(status_code=400, detail="PANEL_API_URL not configured")
-    project = EditorDB.get_project(project_id)
+    project = await _db_call(EditorDB.get_project, project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
-    pages = EditorDB.get_pages(project_id)
+    pages = await _db_call(EditorDB.get_pages, project_id)
     if not pages:
         raise HTTPException(status_code=400, detail="No pages in project")
 
     project_dir = os.path.join(MANGA_DIR, project_id)
     os.makedirs(project_dir, exist_ok=True)
 
-    results: Dict[int, int] = {}
-    for pg in pages:
+    async def process_page(client: httpx.AsyncClient, pg: Dict[str, Any]) -> Optional[Tuple[int, int]]:
         pn = int(pg["page_number"])
         img_path = pg["image_path"]
         # Resolve local absolute path if needed
@@ -1761,176 +2904,97 @@ async def api_create_panels(project_id: str):
                 abs_path = fallback
         if not os.path.exists(abs_path):
             logger.warning(f"[panels/create] Skipping page {pn}: file not found {img_path}")
-            continue
-        try:
-            # Send file with optional upstream params (match legacy behavior)
-            # Add retry logic for unreliable connections (ngrok, etc.)
-            max_retries = 3
-            retry_delay = 2
-            r = None
-            
-            for attempt in range(max_retries):
-                try:
-                    with open(abs_path, "rb") as f:
-                        files = {"file": (os.path.basename(abs_path), f, "image/png")}
-                        params = {
-                            "add_border": "true",
-                            "border_width": 4,
-                            "border_color": "black",
-                            "curved_border": "true",
-                            "corner_radius": 20,
-                        }
-                        logger.info(f"[panels/create] Posting page {pn} to PANEL_API_URL (attempt {attempt+1}/{max_retries}): {PANEL_API_URL}")
-                        async with httpx.AsyncClient(timeout=600.0) as client:
-                            r = await client.post(PANEL_API_URL, files=files, params=params)
-                        break  # Success
-                except (httpx.TimeoutException, httpx.ConnectError, httpx.NetworkError) as e:
-                    if attempt < max_retries - 1:
-                        import asyncio
-                        wait_time = retry_delay * (2 ** attempt)
-                        logger.warning(f"[panels/create] Connection error for page {pn} on attempt {attempt+1}, retrying in {wait_time}s: {str(e)[:100]}")
-                        await asyncio.sleep(wait_time)
-                    else:
-                        logger.error(f"[panels/create] All {max_retries} attempts failed for page {pn}")
-                        continue  # Skip this page and continue with next
-            
-            if r is None:
-                logger.warning(f"[panels/create] No response received for page {pn}, skipping")
-                continue
+            return None
+        async with sem:
+            try:
+                # Send file with optional upstream params (match legacy behavior)
+                # Add retry logic for unreliable connections (ngrok, etc.)
+                max_retries = 3
+                retry_delay = 2
+                status = None
+                content_type = ""
+                body = None
+                from_cache = False
+
+                img_hash = await asyncio.to_thread(_file_digest, abs_path)
+                cached = None if refresh else await _db_call(EditorDB.get_panel_cache, img_hash, _PANEL_PARAMS_HASH)
+                if cached:
+                    logger.info(f"[panels/create] Page {pn}: reusing cached upstream response")
+                    status, content_type, body, from_cache = 200, cached[1], io.BytesIO(cached[0]), True
                 
-            if r.status_code != 200:
-                logger.warning(f"[panels/create] Upstream error for page {pn}: status {r.status_code}")
-                continue
-            content_type = r.headers.get("content-type", "").lower()
-            panel_paths: List[str] = []
-            if "application/json" in content_type:
-                # Accept multiple shapes from upstream
-                try:
-                    data = r.json()
-                except Exception:
-                    data = {}
-                boxes = (
-                    data.get("panels")
-                    or data.get("panel_boxes")
-                    or data.get("boxes")
-                    or data.get("bboxes")
-                    or []
-                )
-                # Normalize entries to [x1,y1,x2,y2]
-                norm_boxes: List[Tuple[int,int,int,int]] = []
-                for b in boxes:
+                for attempt in range(0 if from_cache else max_retries):
                     try:
-                        if isinstance(b, dict):
-                            # Support dict with x,y,w,h or x1,y1,x2,y2
-                            if all(k in b for k in ("x","y","w","h")):
-                                x1 = int(b["x"]) ; y1 = int(b["y"]) ; x2 = x1 + int(b["w"]) ; y2 = y1 + int(b["h"]) 
-                                norm_boxes.append((x1,y1,x2,y2))
-                            elif all(k in b for k in ("x1","y1","x2","y2")):
-                                norm_boxes.append((int(b["x1"]), int(b["y1"]), int(b["x2"]), int(b["y2"])))
-                        elif isinstance(b, (list, tuple)) and len(b) == 4:
-                            x1,y1,x2,y2 = map(int, b)
-                            norm_boxes.append((x1,y1,x2,y2))
-                    except Exception:
-                        continue
-                # Crop locally (fallback to full page if no boxes)
-                image = Image.open(abs_path).convert("RGB")
-                if not norm_boxes:
-                    w,h = image.size
-                    norm_boxes = [(0,0,w,h)]
-                page_dir = os.path.join(project_dir, f"page_{pn:03d}")
-                os.makedirs(page_dir, exist_ok=True)
-                panel_paths = []
-                for idx, (x1,y1,x2,y2) in enumerate(norm_boxes):
-                    crop = image.crop((x1,y1,x2,y2))
-                    out_name = f"panel_{idx:03d}.png"
-                    out_abs = os.path.join(page_dir, out_name)
-                    crop.save(out_abs)
-                    rel = f"/manga_projects/{project_id}/page_{pn:03d}/{out_name}"
-                    panel_paths.append(rel)
-            elif ("application/zip" in content_type) or ("zip" in content_type) or (r.content[:2] == b"PK"):
-                from zipfile import ZipFile
-                from io import BytesIO
-                page_dir = os.path.join(project_dir, f"page_{pn:03d}")
-                os.makedirs(page_dir, exist_ok=True)
-                zf = ZipFile(BytesIO(r.content))
-                panel_paths = []
-                for name in zf.namelist():
-                    if name.endswith("/"):
-                        continue
-                    data = zf.read(name)
-                    # normalize filename
-                    base = os.path.basename(name)
-                    safe = re.sub(r"[^A-Za-z0-9_.-]", "_", base)
-                    out_abs = os.path.join(page_dir, safe)
-                    with open(out_abs, "wb") as wf:
-                        wf.write(data)
-                    rel = f"/manga_projects/{project_id}/page_{pn:03d}/{safe}"
-                    panel_paths.append(rel)
-            elif ("image/" in content_type) or r.content[:8].startswith(b"\x89PNG") or r.content[:2] == b"\xff\xd8":
-                # Single image fallback: treat as one panel
-                page_dir = os.path.join(project_dir, f"page_{pn:03d}")
-                os.makedirs(page_dir, exist_ok=True)
-                out_abs = os.path.join(page_dir, "panel_000.png")
-                with open(out_abs, "wb") as wf:
-                    wf.write(r.content)
-                panel_paths = [f"/manga_projects/{project_id}/page_{pn:03d}/panel_000.png"]
-            else:
-                # Unknown content-type: attempt to parse as JSON first, else fallback to single image
-                try:
-                    data = r.json()
-                    boxes = data.get("panels") or data.get("panel_boxes") or data.get("boxes") or data.get("bboxes") or []
-                    image = Image.open(abs_path).convert("RGB")
-                    if not boxes:
-                        w,h = image.size
-                        boxes = [(0,0,w,h)]
-                    page_dir = os.path.join(project_dir, f"page_{pn:03d}")
-                    os.makedirs(page_dir, exist_ok=True)
-                    panel_paths = []
-                    for idx, b in enumerate(boxes):
-                        if isinstance(b, dict) and all(k in b for k in ("x","y","w","h")):
-                            x1 = int(b["x"]) ; y1 = int(b["y"]) ; x2 = x1 + int(b["w"]) ; y2 = y1 + int(b["h"]) 
+                        with open(abs_path, "rb") as f:
+                            files = {"file": (os.path.basename(abs_path), f, "image/png")}
+                            logger.info(f"[panels/create] Posting page {pn} to PANEL_API_URL (attempt {attempt+1}/{max_retries}): {PANEL_API_URL}")
+                            # Stream the body into a spool file rather than holding it all in memory
+                            async with client.stream("POST", PANEL_API_URL, files=files, params=_PANEL_API_PARAMS, timeout=600.0) as r:
+                                status = r.status_code
+                                content_type = r.headers.get("content-type", "").lower()
+                                if status == 200:
+                                    body = await _spool_response(r)
+                        break  # Success
+                    except (httpx.TimeoutException, httpx.ConnectError, httpx.NetworkError) as e:
+                        if attempt < max_retries - 1:
+                            wait_time = retry_delay * (2 ** attempt)
+                            logger.warning(f"[panels/create] Connection error for page {pn} on attempt {attempt+1}, retrying in {wait_time}s: {str(e)[:100]}")
+                            await asyncio.sleep(wait_time)
                         else:
-                            x1,y1,x2,y2 = map(int, b)
-                        crop = image.crop((x1,y1,x2,y2))
-                        out_name = f"panel_{idx:03d}.png"
-                        out_abs = os.path.join(page_dir, out_name)
-                        crop.save(out_abs)
-                        rel = f"/manga_projects/{project_id}/page_{pn:03d}/{out_name}"
-                        panel_paths.append(rel)
-                except Exception:
-                    page_dir = os.path.join(project_dir, f"page_{pn:03d}")
-                    os.makedirs(page_dir, exist_ok=True)
-                    out_abs = os.path.join(page_dir, "panel_000.bin")
-                    with open(out_abs, "wb") as wf:
-                        wf.write(r.content)
-                    # Don't register unknown binary as a panel; skip
-                    panel_paths = []
-
-            EditorDB.set_panels_for_page(project_id, pn, panel_paths)
-            results[pn] = len(panel_paths)
-            if panel_paths:
-                logging.warning(f"[panels/create] Page {pn}: saved {len(panel_paths)} panels")
-            else:
-                logging.warning(f"[panels/create] Page {pn}: no panels produced by upstream response")
-        except Exception:
-            logging.exception(f"[panels/create] Exception while processing page {pn}")
-            continue
+                            logger.error(f"[panels/create] All {max_retries} attempts failed for page {pn}")
+                
+                if status is None:
+                    logger.warning(f"[panels/create] No response received for page {pn}, skipping")
+                    return None
+                    
+                if status != 200:
+                    logger.warning(f"[panels/create] Upstream error for page {pn}: status {status}")
+                    return None
+                # Cropping / unzipping is blocking file and Pillow work; keep it off the event loop
+                try:
+                    panel_paths = await asyncio.to_thread(_write_panel_files, project_id, pn, abs_path, content_type, body)
+                    if panel_paths and not from_cache:
+                        size = body.seek(0, os.SEEK_END)
+                        if size <= _PANEL_CACHE_MAX_BYTES:
+                            body.seek(0)
+                            await _db_call(EditorDB.put_panel_cache, img_hash, _PANEL_PARAMS_HASH, body.read(), content_type, project_id)
+                finally:
+                    body.close()
+
+                if panel_paths:
+                    logging.warning(f"[panels/create] Page {pn}: saved {len(panel_paths)} panels")
+                else:
+                    logging.warning(f"[panels/create] Page {pn}: no panels produced by upstream response")
+                return pn, panel_paths
+            except Exception:
+                logging.exception(f"[panels/create] Exception while processing page {pn}")
+                return None
+
+    # Pages are independent: post them concurrently, capped so the upstream detector isn't flooded
+    sem = asyncio.Semaphore(_PANEL_CONCURRENCY)
+    outcomes = await asyncio.gather(*(process_page(_get_http_client(), pg) for pg in pages))
+    saved = [o for o in outcomes if o]
+    # Record every page's panels in one transaction (one commit) once all pages are done
+    await _db_call(EditorDB.set_panels_for_pages, project_id, saved)
+    results: Dict[int, int] = {pn: len(panel_paths) for pn, panel_paths in saved}
 
     return {"ok": True, "created": results}
 
 
 @router.post("/api/project/{project_id:path}/panels/create/page/{page_number}")
-async def api_create_panels_single_page(project_id: str, page_number: int):
-    """Create panels for a single page, used for granular progress in the UI."""
+async def api_create_panels_single_page(project_id: str, page_number: int, refresh: bool = False):
+    """Create panels for a single page, used for granular progress in the UI.
+
+    refresh=true (an explicit re-detect) bypasses the stored upstream response.
+    """
     # Check local model first
     from panel_detection import model_manager
     if model_manager.model is not None:
         logger.info(f"[panels/create/page] Using local MagiV3 model for page {page_number}")
         try:
-            project = EditorDB.get_project(project_id)
+            project = await _db_call(EditorDB.get_project, project_id)
             if not project:
                 raise HTTPException(status_code=404, detail="Project not found")
-            pages = EditorDB.get_pages(project_id)
+            pages = await _db_call(EditorDB.get_pages, project_id)
             pg = next((p for p in pages if int(p.get("page_number") or 0) == int(page_number)), None)
             if not pg:
                 raise HTTPException(status_code=404, detail="Page not found")
@@ -1961,7 +3025,7 @@ async def api_create_panels_single_page(project_id: str, page_number: int):
                 raise HTTPException(status_code=404, detail=f"File not found: {img_path}")
 
             # Run prediction
-            image = Image.open(abs_path).convert("RGB")
+            image = _open_rgb(abs_path)
             logger.info(f"[panels/create/page] Loaded source image from: {abs_path}")
             # Force load image data into memory so we can safely delete its directory if needed
             image.load()
@@ -1972,7 +3036,6 @@ async def api_create_panels_single_page(project_id: str, page_number: int):
             page_dir = os.path.join(project_dir, f"page_{pn:03d}")
             # Clean up existing directory to avoid ghost panels from renumbering
             if os.path.exists(page_dir):
-                import shutil
                 try:
                     logger.info(f"[panels/create/page] Cleaning up directory: {page_dir}")
                     shutil.rmtree(page_dir)
@@ -1980,23 +3043,19 @@ async def api_create_panels_single_page(project_id: str, page_number: int):
                     logger.warning(f"Failed to clean page directory {page_dir}: {e}")
 
             os.makedirs(page_dir, exist_ok=True)
-            panel_paths = []
             
             # Handle empty result
             if not boxes:
                 w, h = image.size
                 boxes = [[0, 0, w, h]]
                 
-            for idx, box in enumerate(boxes):
-                x1, y1, x2, y2 = map(int, box)
-                crop = image.crop((x1, y1, x2, y2))
-                out_name = f"panel_{idx:03d}.png"
-                out_abs = os.path.join(page_dir, out_name)
-                crop.save(out_abs)
-                rel = f"/manga_projects/{project_id}/page_{pn:03d}/{out_name}"
-                panel_paths.append(rel)
+            norm_boxes = _normalize_boxes(list(boxes))
+            url_prefix = f"/manga_projects/{project_id}/page_{pn:03d}"
+            panel_paths = _copy_whole_page(abs_path, norm_boxes, page_dir, url_prefix)
+            if panel_paths is None:
+                panel_paths = _save_panel_crops(image, norm_boxes, page_dir, url_prefix)
                 
-            EditorDB.set_panels_for_page(project_id, pn, panel_paths)
+            await _db_call(EditorDB.set_panels_for_page, project_id, pn, panel_paths)
             created = len(panel_paths)
             logging.info(f"[panels/create/page] Local model: Page {pn}: saved {created} panels")
             return {"ok": True, "page_number": pn, "created": created}
@@ -2008,10 +3067,10 @@ async def api_create_panels_single_page(project_id: str, page_number: int):
 
     if not PANEL_API_URL:
         raise HTTPException(status_code=400, detail="PANEL_API_URL not configured")
-    project = EditorDB.get_project(project_id)
+    project = await _db_call(EditorDB.get_project, project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
-    pages = EditorDB.get_pages(project_id)
+    pages = await _db_call(EditorDB.get_pages, project_id)
     pg = next((p for p in pages if int(p.get("page_number") or 0) == int(page_number)), None)
     if not pg:
         raise HTTPException(status_code=404, detail="Page not found")
@@ -2046,28 +3105,30 @@ async def api_create_panels_single_page(project_id: str, page_number: int):
         # Add retry logic for unreliable connections (ngrok, etc.)
         max_retries = 3
         retry_delay = 2  # seconds
-        last_exception = None
-        r = None
+        status = None
+        content_type = ""
+        body = None
+
+        img_hash = await asyncio.to_thread(_file_digest, abs_path)
+        cached = None if refresh else await _db_call(EditorDB.get_panel_cache, img_hash, _PANEL_PARAMS_HASH)
+        if cached:
+            logger.info(f"[panels/create/page] Page {pn}: reusing cached upstream response")
+            status, content_type, body = 200, cached[1].lower(), io.BytesIO(cached[0])
         
-        for attempt in range(max_retries):
+        for attempt in range(0 if cached else max_retries):
             try:
                 with open(abs_path, "rb") as f:
                     files = {"file": (os.path.basename(abs_path), f, "image/png")}
-                    params = {
-                        "add_border": "true",
-                        "border_width": 4,
-                        "border_color": "black",
-                        "curved_border": "true",
-                        "corner_radius": 20,
-                    }
                     logger.info(f"[panels/create/page] Posting page {pn} to PANEL_API_URL (attempt {attempt+1}/{max_retries}): {PANEL_API_URL}")
-                    async with httpx.AsyncClient(timeout=600.0) as client:
-                        r = await client.post(PANEL_API_URL, files=files, params=params)
+                    # Spool the body (memory, then disk past _SPOOL_MAX_BYTES) instead of buffering r.content
+                    async with _get_http_client().stream("POST", PANEL_API_URL, files=files, params=_PANEL_API_PARAMS, timeout=600.0) as r:
+                        status = r.status_code
+                        content_type = r.headers.get("content-type", "").lower()
+                        if status == 200:
+                            body = await _spool_response(r)
                     break  # Success, exit retry loop
             except (httpx.TimeoutException, httpx.ConnectError, httpx.NetworkError) as e:
-                last_exception = e
                 if attempt < max_retries - 1:
-                    import asyncio
                     wait_time = retry_delay * (2 ** attempt)  # Exponential backoff
                     logger.warning(f"[panels/create/page] Connection error on attempt {attempt+1}, retrying in {wait_time}s: {str(e)[:100]}")
                     await asyncio.sleep(wait_time)
@@ -2075,110 +3136,23 @@ async def api_create_panels_single_page(project_id: str, page_number: int):
                     logger.error(f"[panels/create/page] All {max_retries} attempts failed for page {pn}")
                     raise HTTPException(status_code=502, detail=f"Failed to connect to panel API after {max_retries} attempts: {str(e)[:200]}")
         
-        if r is None:
+        if status is None:
             raise HTTPException(status_code=502, detail="Failed to get response from panel API")
             
-        if r.status_code != 200:
-            raise HTTPException(status_code=502, detail=f"Upstream error: {r.status_code}")
-        content_type = r.headers.get("content-type", "").lower()
-        panel_paths: List[str] = []
-        if "application/json" in content_type:
-            try:
-                data = r.json()
-            except Exception:
-                data = {}
-            boxes = (
-                data.get("panels")
-                or data.get("panel_boxes")
-                or data.get("boxes")
-                or data.get("bboxes")
-                or []
-            )
-            # Normalize entries to [x1,y1,x2,y2]
-            norm_boxes: List[Tuple[int,int,int,int]] = []
-            for b in boxes:
-                try:
-                    if isinstance(b, dict):
-                        if all(k in b for k in ("x","y","w","h")):
-                            x1 = int(b["x"]) ; y1 = int(b["y"]) ; x2 = x1 + int(b["w"]) ; y2 = y1 + int(b["h"]) 
-                            norm_boxes.append((x1,y1,x2,y2))
-                        elif all(k in b for k in ("x1","y1","x2","y2")):
-                            norm_boxes.append((int(b["x1"]), int(b["y1"]), int(b["x2"]), int(b["y2"])))
-                    elif isinstance(b, (list, tuple)) and len(b) == 4:
-                        x1,y1,x2,y2 = map(int, b)
-                        norm_boxes.append((x1,y1,x2,y2))
-                except Exception:
-                    continue
-            image = Image.open(abs_path).convert("RGB")
-            if not norm_boxes:
-                w,h = image.size
-                norm_boxes = [(0,0,w,h)]
-            page_dir = os.path.join(project_dir, f"page_{pn:03d}")
-            os.makedirs(page_dir, exist_ok=True)
-            panel_paths = []
-            for idx, (x1,y1,x2,y2) in enumerate(norm_boxes):
-                crop = image.crop((x1,y1,x2,y2))
-                out_name = f"panel_{idx:03d}.png"
-                out_abs = os.path.join(page_dir, out_name)
-                crop.save(out_abs)
-                rel = f"/manga_projects/{project_id}/page_{pn:03d}/{out_name}"
-                panel_paths.append(rel)
-        elif ("application/zip" in content_type) or ("zip" in content_type) or (r.content[:2] == b"PK"):
-            from zipfile import ZipFile
-            from io import BytesIO
-            page_dir = os.path.join(project_dir, f"page_{pn:03d}")
-            os.makedirs(page_dir, exist_ok=True)
-            zf = ZipFile(BytesIO(r.content))
-            panel_paths = []
-            for name in zf.namelist():
-                if name.endswith("/"):
-                    continue
-                data = zf.read(name)
-                base = os.path.basename(name)
-                safe = re.sub(r"[^A-Za-z0-9_.-]", "_", base)
-                out_abs = os.path.join(page_dir, safe)
-                with open(out_abs, "wb") as wf:
-                    wf.write(data)
-                rel = f"/manga_projects/{project_id}/page_{pn:03d}/{safe}"
-                panel_paths.append(rel)
-        elif ("image/" in content_type) or r.content[:8].startswith(b"\x89PNG") or r.content[:2] == b"\xff\xd8":
-            page_dir = os.path.join(project_dir, f"page_{pn:03d}")
-            os.makedirs(page_dir, exist_ok=True)
-            out_abs = os.path.join(page_dir, "panel_000.png")
-            with open(out_abs, "wb") as wf:
-                wf.write(r.content)
-            panel_paths = [f"/manga_projects/{project_id}/page_{pn:03d}/panel_000.png"]
-        else:
-            try:
-                data = r.json()
-                boxes = data.get("panels") or data.get("panel_boxes") or data.get("boxes") or data.get("bboxes") or []
-                image = Image.open(abs_path).convert("RGB")
-                if not boxes:
-                    w,h = image.size
-                    boxes = [(0,0,w,h)]
-                page_dir = os.path.join(project_dir, f"page_{pn:03d}")
-                os.makedirs(page_dir, exist_ok=True)
-                panel_paths = []
-                for idx, b in enumerate(boxes):
-                    if isinstance(b, dict) and all(k in b for k in ("x","y","w","h")):
-                        x1 = int(b["x"]) ; y1 = int(b["y"]) ; x2 = x1 + int(b["w"]) ; y2 = y1 + int(b["h"]) 
-                    else:
-                        x1,y1,x2,y2 = map(int, b)
-                    crop = image.crop((x1,y1,x2,y2))
-                    out_name = f"panel_{idx:03d}.png"
-                    out_abs = os.path.join(page_dir, out_name)
-                    crop.save(out_abs)
-                    rel = f"/manga_projects/{project_id}/page_{pn:03d}/{out_name}"
-                    panel_paths.append(rel)
-            except Exception:
-                page_dir = os.path.join(project_dir, f"page_{pn:03d}")
-                os.makedirs(page_dir, exist_ok=True)
-                out_abs = os.path.join(page_dir, "panel_000.bin")
-                with open(out_abs, "wb") as wf:
-                    wf.write(r.content)
-                panel_paths = []
-
-        EditorDB.set_panels_for_page(project_id, pn, panel_paths)
+        if status != 200:
+            raise HTTPException(status_code=502, detail=f"Upstream error: {status}")
+        # Cropping / unzipping is blocking file and Pillow work; keep it off the event loop
+        try:
+            panel_paths = await asyncio.to_thread(_write_panel_files, project_id, pn, abs_path, content_type, body)
+
+            await _db_call(EditorDB.set_panels_for_page, project_id, pn, panel_paths)
+            if panel_paths and not cached:
+                size = body.seek(0, os.SEEK_END)
+                if size <= _PANEL_CACHE_MAX_BYTES:
+                    body.seek(0)
+                    await _db_call(EditorDB.put_panel_cache, img_hash, _PANEL_PARAMS_HASH, body.read(), content_type, project_id)
+        finally:
+            body.close()
         created = len(panel_paths)
         logging.warning(f"[panels/create/page] Page {pn}: saved {created} panels")
         return {"ok": True, "page_number": pn, "created": created}
@@ -2189,6 +3163,23 @@ async def api_create_panels_single_page(project_id: str, page_number: int):
         raise HTTPException(status_code=500, detail="Failed to create panels for this page")
 
 
+def _outer_json_object(text: str) -> Optional[str]:
+    """Outermost {...} span of a model reply that may wrap its JSON in prose or code fences.
+
+    Same span a greedy "{ ... }" regex search would return, found with one find/rfind pair
+    instead of a regex that rescans the tail from every '{' when there is no closing brace.
+    """
+    start = text.find("{")
+    if start < 0:
+        return None
+    end = text.rfind("}")
+    return text[start:end + 1] if end > start else None
+
+
+# Fallback narration split: the stripped, non-empty pieces between periods, in one scan
+_SENT_RE = re.compile(r"[^.\s](?:[^.]*[^.\s])?")
+
+
 @router.post("/api/project/{project_id:path}/narrate/sequential")
 async def api_narrate_sequential(project_id: str, payload: Dict[str, Any]):
     """
@@ -2199,24 +3190,20 @@ async def api_narrate_sequential(project_id: str, payload: Dict[str, Any]):
     if genai is None or not _GEMINI_KEYS:
         raise HTTPException(status_code=400, detail="Gemini not configured. Set GOOGLE_API_KEYS.")
 
-    project = EditorDB.get_project(project_id)
+    project = await _db_call(EditorDB.get_project, project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
-    pages = EditorDB.get_pages(project_id)
+    pages = await _db_call(EditorDB.get_pages, project_id)
     if not pages:
         raise HTTPException(status_code=400, detail="Project has no pages")
 
     start_page = int(payload.get("startPage") or pages[0].get("page_number") or 1)
     end_page = int(payload.get("endPage") or pages[-1].get("page_number") or start_page)
-    char_md = str(payload.get("characterList") or EditorDB.get_character_list(project_id) or "")
+    char_md = str(payload.get("characterList") or await _db_call(EditorDB.get_character_list, project_id) or "")
 
     # Check if this project belongs to a manga series
     # Get previous chapters' context if available
-    conn = EditorDB.conn()
-    row = conn.execute(
-        "SELECT manga_series_id, chapter_number FROM project_details WHERE id=?",
-        (project_id,)
-    ).fetchone()
+    row = await _db_call(EditorDB.get_series_position, project_id)
     
     previous_context = ""
     if row and row[0]:  # Has a manga_series_id
@@ -2224,15 +3211,15 @@ async def api_narrate_sequential(project_id: str, payload: Dict[str, Any]):
         current_chapter = row[1]
         if current_chapter and current_chapter > 1:
             # Get accumulated context from all previous chapters
-            prev_chars, prev_summary = EditorDB.get_previous_chapters_context(series_id, current_chapter)
+            prev_chars, prev_summary = await _db_call(EditorDB.get_previous_chapters_context, series_id, current_chapter)
             if prev_summary:
                 previous_context = f"\n\n=== STORY SO FAR (From Previous Chapters) ===\n{prev_summary}\n\n=== CURRENT CHAPTER BEGINS ===\n"
             if prev_chars and not char_md:
                 # Use accumulated character list from previous chapters if current one is empty
                 char_md = prev_chars
 
-    # Accumulated narrative context (plain text)
-    accumulated_text = previous_context
+    # Accumulated narrative context (plain text), kept as parts and joined once per page
+    accumulated_parts: List[str] = [previous_context]
     results: List[Dict[str, Any]] = []
 
     first_page_processed = False # Track if we are on the first processed page to force new tab
@@ -2261,39 +3248,54 @@ async def api_narrate_sequential(project_id: str, payload: Dict[str, Any]):
         executor.shutdown(wait=False)
         raise HTTPException(status_code=500, detail=f"Failed to start automation session: {e}")
 
+    # One query for the chapter's panels; pages without any are skipped up front, before
+    # any image load, prompt building or model call
+    panels_by_page = await _db_call(EditorDB.get_panels_for_project, project_id)
+
+    async def _fetch_page(pn: int) -> Tuple[List[Dict[str, Any]], List[str], List[bytes]]:
+        """Load a page's panels, their image URLs (resolved once per page) and image bytes."""
+        panels = panels_by_page[pn]
+        panel_urls = _panel_image_urls(panels)
+        return panels, panel_urls, await _load_panel_images(panel_urls)
+
+    # Pages stay strictly sequential (each prompt carries the narration of the pages before it),
+    # but the next page's panels are loaded while the current page's model call is in flight.
+    page_numbers = [
+        pn for pn in (int(pg.get("page_number") or 0) for pg in pages)
+        if start_page <= pn <= end_page and pn in panels_by_page
+    ]
+    prefetch: Optional[asyncio.Future] = None
+    if page_numbers:
+        prefetch = asyncio.ensure_future(_fetch_page(page_numbers[0]))
+
+    provider_override = str(payload.get("narration_provider") or "").strip()
+    if provider_override:
+         await _db_call(EditorDB.set_project_provider, project_id, provider_override)
+         provider = provider_override
+         project["narration_provider"] = provider_override 
+    else:
+         provider = str(project.get("narration_provider") or "gemini")
+    # Groq/Azure SDK clients are built once per request and reuse their connection pool across pages.
+    # Gemini models stay per page: _gemini_client rotates through GOOGLE_API_KEYS on each call.
+    groq_client = _groq_client() if provider == "groq" else None
+    azure_client = _azure_client() if provider == "azure" else None
+    build_page_prompt = _build_page_prompt_factory(char_md)
+
     try:
-        for pg in pages:
-            pn = int(pg.get("page_number") or 0)
-            if pn < start_page or pn > end_page:
-                continue
-            panels = EditorDB.get_panels_for_page(project_id, pn)
-            # Load images
-            imgs: List[bytes] = []
-            for p in panels:
-                img_url = extract_panel_image(p)
-                if not img_url:
-                    continue
-                b = await _load_image_bytes(img_url)
-            if b:
-                imgs.append(b)
+        for pos, pn in enumerate(page_numbers):
+            panels, panel_urls, imgs = await prefetch
+            prefetch = asyncio.ensure_future(_fetch_page(page_numbers[pos + 1])) if pos + 1 < len(page_numbers) else None
 
             if not imgs:
                 continue
 
+            accumulated_text = "".join(accumulated_parts)
             data = None 
             txt = "" 
 
-            provider_override = str(payload.get("narration_provider") or "").strip()
-            if provider_override:
-                 EditorDB.set_project_provider(project_id, provider_override)
-                 provider = provider_override
-                 project["narration_provider"] = provider_override 
-            else:
-                 provider = str(project.get("narration_provider") or "gemini")
-            
             # --- MANUAL WEB (Automation) ---
             if provider == "manual_web":
-                processed_images = _number_images([p["path"] for p in [{"path": extract_panel_image(p)} for p in panels] if p["path"]])
+                processed_images = _number_images(panel_urls)
                 
                 sys_instructions = (
                     "You are a manga narration assistant. For the given page, write a cohesive, flowing micro‑narrative that spans the panels in order. "
@@ -2322,10 +3324,9 @@ async def api_narrate_sequential(project_id: str, payload: Dict[str, Any]):
                     
                     # Parse JSON
                     try:
-                        import re
-                        json_match = re.search(r"(\{[\s\S]*\})", resp_text)
-                        if json_match:
-                            cleaned_text = json_match.group(1)
+                        json_span = _outer_json_object(resp_text)
+                        if json_span is not None:
+                            cleaned_text = json_span
                             data = json.loads(cleaned_text)
                         else:
                             cleaned_text = resp_text.strip()
@@ -2343,10 +3344,10 @@ async def api_narrate_sequential(project_id: str, payload: Dict[str, Any]):
             elif provider == "groq":
                 # Groq model restriction: max 5 images
                 if len(imgs) > 5:
-                    logger.warning(f"Page {pg.get('page_number')} has {len(imgs)} panels. Groq limit 5. Truncating.")
+                    logger.warning(f"Page {pn} has {len(imgs)} panels. Groq limit 5. Truncating.")
                     imgs = imgs[:5]
                 
-                client = _groq_client()
+                client = groq_client
                 if not client:
                     logging.error("Groq client init failed")
                     continue
@@ -2357,7 +3358,7 @@ async def api_narrate_sequential(project_id: str, payload: Dict[str, Any]):
                 
                 for attempt in range(3):
                     try:
-                        completion = client.chat.completions.create(
+                        completion = await asyncio.to_thread(client.chat.completions.create,
                             model="meta-llama/llama-4-scout-17b-16e-instruct", # Using vision model
                             messages=messages,
                             temperature=0.7,
@@ -2398,7 +3399,7 @@ async def api_narrate_sequential(project_id: str, payload: Dict[str, Any]):
                     # Truncate
                     imgs = imgs[:5]
 
-                client = _azure_client()
+                client = azure_client
                 if not client:
                     raise HTTPException(status_code=400, detail="Azure OpenAI keys not configured")
 
@@ -2429,7 +3430,7 @@ async def api_narrate_sequential(project_id: str, payload: Dict[str, Any]):
                     img_sizes = [len(b) for b in imgs]
                     logger.info(f"Azure Sequential Payload: Page {pn}, {len(msgs_to_send)} messages. Images: {len(imgs)}, Sizes: {img_sizes}")
 
-                    completion = client.chat.completions.create(
+                    completion = await asyncio.to_thread(client.chat.completions.create,
                         model="gpt-5-nano",
                         messages=msgs_to_send,
                         max_completion_tokens=25000,
@@ -2464,7 +3465,7 @@ async def api_narrate_sequential(project_id: str, payload: Dict[str, Any]):
                 if genai is None:
                      raise HTTPException(status_code=400, detail="Gemini lib not installed")
                 
-                contents = _build_page_prompt(pn, imgs, accumulated_text, char_md)
+                contents = await asyncio.to_thread(build_page_prompt, pn, imgs, accumulated_text)
                 model = _gemini_client()
                 if not model:
                      raise HTTPException(status_code=500, detail="Gemini client init failed")
@@ -2474,7 +3475,7 @@ async def api_narrate_sequential(project_id: str, payload: Dict[str, Any]):
 
                 for attempt in range(3):
                     try:
-                         resp = model.generate_content(contents)
+                         resp = await asyncio.to_thread(model.generate_content, contents)
                          txt = resp.text
                          try:
                             extracted = json.loads(txt)
@@ -2530,53 +3531,43 @@ async def api_narrate_sequential(project_id: str, payload: Dict[str, Any]):
                     combined = " ".join(merged.get(i) or [])
                     # Only update if we actually have text for this panel in this run
                     if combined:
-                        EditorDB.upsert_panel_narration(project_id, pn, i, combined, is_manual=False)
                         # Ensure any existing audio URL (if a previous synth created it) remains intact; no change here
                         page_out.append({"panel_index": i, "text": combined})
-                # Cleanup any legacy rows without images on this page
-                try:
-                    EditorDB.conn().execute(
-                        "DELETE FROM panels WHERE project_id=? AND page_number=? AND (image_path IS NULL OR image_path='')",
-                        (project_id, pn),
-                    )
-                    EditorDB.conn().commit()
-                except Exception:
-                    pass
+                # One transaction per page
+                await _db_call(EditorDB.set_page_narrations, project_id, pn, [(o["panel_index"], o["text"]) for o in page_out])
                 # Append to accumulated context
-                accumulated_text += f"\nPage {pn}: " + "; ".join([f"[{i['panel_index']}] {i['text']}" for i in page_out])
+                accumulated_parts.append(f"\nPage {pn}: " + "; ".join([f"[{i['panel_index']}] {i['text']}" for i in page_out]))
                 results.append({"page_number": pn, "panels": page_out})
             else:
                 # Fallback: treat as a single blob, assign in order
                 # Split into sentences roughly equal to panel count
                 text_blob = txt.strip()
-                segs = [s.strip() for s in text_blob.split(".") if s.strip()]
+                segs = _SENT_RE.findall(text_blob)
                 page_out = []
                 if len(panels) == 1:
                     # Put all narration into the first panel
                     combined = (". ".join(segs).strip() + ".") if segs else ""
-                    EditorDB.upsert_panel_narration(project_id, pn, 1, combined, is_manual=False)
                     page_out.append({"panel_index": 1, "text": combined})
                 else:
                     for idx1 in range(1, len(panels) + 1):
                         t = (segs[idx1 - 1] + ".") if (idx1 - 1) < len(segs) else ""
-                        EditorDB.upsert_panel_narration(project_id, pn, idx1, t, is_manual=False)
                         page_out.append({"panel_index": idx1, "text": t})
-                # Cleanup any legacy rows without images on this page
-                try:
-                    EditorDB.conn().execute(
-                        "DELETE FROM panels WHERE project_id=? AND page_number=? AND (image_path IS NULL OR image_path='')",
-                        (project_id, pn),
-                    )
-                    EditorDB.conn().commit()
-                except Exception:
-                    pass
-                accumulated_text += f"\nPage {pn}: " + "; ".join([f"[{i['panel_index']}] {i['text']}" for i in page_out])
+                await _db_call(EditorDB.set_page_narrations, project_id, pn, [(o["panel_index"], o["text"]) for o in page_out])
+                accumulated_parts.append(f"\nPage {pn}: " + "; ".join([f"[{i['panel_index']}] {i['text']}" for i in page_out]))
                 results.append({"page_number": pn, "panels": page_out})
 
     except Exception as e:
         logger.error(f"Sequential narration wrapper failed: {e}")
         raise e
     finally:
+        if prefetch is not None:
+            prefetch.cancel()
+        # Cleanup any legacy rows without images, once for the whole page range
+        if page_numbers:
+            try:
+                await _db_call(EditorDB.purge_imageless_panels, project_id, start_page, end_page)
+            except Exception:
+                pass
         # Ensure session closed
         try:
              # Run close in the thread too
@@ -2589,19 +3580,15 @@ async def api_narrate_sequential(project_id: str, payload: Dict[str, Any]):
     # Auto-update character list from narrations (best-effort)
     updated_character_list = ""
     try:
-        narr = EditorDB.get_panel_narrations(project_id)
+        narr = await _db_call(EditorDB.get_panel_narrations, project_id)
         logger.debug(f"Auto-update for project {project_id}: Found {len(narr) if narr else 0} narrations")
 
         if narr:
-            # Create a compact context, sorted by page/panel
-            items = []
-            for (pg, idx), text in sorted(narr.items(), key=lambda x: (x[0][0], x[0][1])):
-                items.append(f"Page {pg} Panel {idx}: {text}")
-            corpus = "\n".join(items)
+            corpus = _narration_corpus(narr)
 
             model = _gemini_client()
             if model is not None:
-                logger.debug(f"Generating character list from {len(items)} panels")
+                logger.debug(f"Generating character list from {len(narr)} panels")
                 # First, auto-update character list
                 prompt = (
                     "Analyze the following manga panel narrations and create a comprehensive character list in Markdown format. "
@@ -2611,19 +3598,16 @@ async def api_narrate_sequential(project_id: str, payload: Dict[str, Any]):
                     "Panel Narrations:\n" + corpus
                 )
                 
-                # Check provider for auto-update
-                proj_data = EditorDB.get_project(project_id)
-                provider = proj_data.get("narration_provider", "gemini")
-                
+                # Auto-update uses the provider resolved for this request
                 char_markdown = ""
                 summary = ""
 
                 if provider == "groq":
-                    client = _groq_client()
+                    client = groq_client
                     if client:
                          # Character List
                          try:
-                             resp = client.chat.completions.create(
+                             resp = await asyncio.to_thread(client.chat.completions.create,
                                  model="llama3-8b-8192", # Fast text model
                                  messages=[{"role": "user", "content": prompt}],
                                  temperature=0.7
@@ -2640,7 +3624,7 @@ async def api_narrate_sequential(project_id: str, payload: Dict[str, Any]):
                                 "Keep it engaging and in past tense. Limit to 3-5 paragraphs.\n\n"
                                 "Panel Narrations:\n" + corpus
                              )
-                             resp = client.chat.completions.create(
+                             resp = await asyncio.to_thread(client.chat.completions.create,
                                  model="llama3-8b-8192",
                                  messages=[{"role": "user", "content": prompt_sum}],
                                  temperature=0.7
@@ -2650,7 +3634,7 @@ async def api_narrate_sequential(project_id: str, payload: Dict[str, Any]):
                 
                 elif model is not None: # Gemini
                     try:
-                        resp = model.generate_content(prompt)
+                        resp = await asyncio.to_thread(model.generate_content, prompt)
                         char_markdown = resp.text or ""
                     except Exception: pass
                     
@@ -2662,7 +3646,7 @@ async def api_narrate_sequential(project_id: str, payload: Dict[str, Any]):
                             "Keep it engaging and in past tense. Limit to 3-5 paragraphs.\n\n"
                             "Panel Narrations:\n" + corpus
                         )
-                        resp = model.generate_content(prompt_sum)
+                        resp = await asyncio.to_thread(model.generate_content, prompt_sum)
                         summary = resp.text or ""
                     except Exception: pass
 
@@ -2671,12 +3655,12 @@ async def api_narrate_sequential(project_id: str, payload: Dict[str, Any]):
                         logger.debug(f"Generated character list length: {len(char_markdown)}")
 
                         # Save character list
-                        EditorDB.set_character_list(project_id, char_markdown)
+                        await _db_call(EditorDB.set_character_list, project_id, char_markdown)
                         updated_character_list = char_markdown
                         logger.debug(f"Saved character list to chapter")
 
                         # If part of a series, propagate to all chapters
-                        project = EditorDB.get_project(project_id)
+                        project = await _db_call(EditorDB.get_project, project_id)
                         series_id = None
                         if project:
                             metadata = project.get("metadata") or {}
@@ -2684,8 +3668,8 @@ async def api_narrate_sequential(project_id: str, payload: Dict[str, Any]):
                         
                         logger.debug(f"Series ID: {series_id}")
                         if series_id:
-                            EditorDB.set_series_character_list(series_id, char_markdown)
-                            chapters_updated = EditorDB.propagate_character_list_to_chapters(series_id, char_markdown)
+                            await _db_call(EditorDB.set_series_character_list, series_id, char_markdown)
+                            chapters_updated = await _db_call(EditorDB.propagate_character_list_to_chapters, series_id, char_markdown)
                             logger.debug(f"Propagated character list to series and {chapters_updated} chapters")
                     except Exception as e:
                         logger.warning(f"Failed to auto-update character list: {e}")
@@ -2694,9 +3678,9 @@ async def api_narrate_sequential(project_id: str, payload: Dict[str, Any]):
                 if summary:
                     logger.debug(f"Generated summary length: {len(summary)}")
                     # Save to CURRENT summary field
-                    EditorDB.set_story_summary_current(project_id, summary)
+                    await _db_call(EditorDB.set_story_summary_current, project_id, summary)
                     # Also update legacy field
-                    EditorDB.set_story_summary(project_id, summary)
+                    await _db_call(EditorDB.set_story_summary, project_id, summary)
                     logger.debug(f"Saved story summary")
 
             else:
@@ -2714,29 +3698,21 @@ async def api_narrate_single_page(project_id: str, page_number: int, payload: Di
         if genai is None or not _GEMINI_KEYS:
             raise HTTPException(status_code=400, detail="Gemini not configured. Set GOOGLE_API_KEYS.")
 
-        project = EditorDB.get_project(project_id)
+        project = await _db_call(EditorDB.get_project, project_id)
         if not project:
             raise HTTPException(status_code=404, detail="Project not found")
-        pages = EditorDB.get_pages(project_id)
+        pages = await _db_call(EditorDB.get_pages, project_id)
         # Ensure the page exists
         if not any(int(p["page_number"]) == int(page_number) for p in pages):
             raise HTTPException(status_code=404, detail="Page not found")
-        panels = EditorDB.get_panels_for_page(project_id, int(page_number))
-        imgs: List[bytes] = []
-        for p in panels:
-            img_url = extract_panel_image(p)
-            if not img_url:
-                continue
-            b = await _load_image_bytes(img_url)
-            if b:
-                imgs.append(b)
+        panels = await _db_call(EditorDB.get_panels_for_page, project_id, int(page_number))
+        if not panels:
+            raise HTTPException(status_code=400, detail="Page has no panels")
+        imgs = await _load_panel_images(_panel_image_urls(panels))
         if not imgs:
             raise HTTPException(status_code=400, detail="Page has no panels")
 
-        char_md = str(payload.get("characterList") or EditorDB.get_character_list(project_id) or "")
-        context_txt = str(payload.get("context") or "")
-
-        char_md = str(payload.get("characterList") or EditorDB.get_character_list(project_id) or "")
+        char_md = str(payload.get("characterList") or await _db_call(EditorDB.get_character_list, project_id) or "")
         context_txt = str(payload.get("context") or "")
 
         provider = str(project.get("narration_provider") or "gemini")
@@ -2789,7 +3765,7 @@ async def api_narrate_single_page(project_id: str, page_number: int, payload: Di
              last_error = None
              for attempt in range(3):
                  try:
-                     completion = client.chat.completions.create(
+                     completion = await asyncio.to_thread(client.chat.completions.create,
                             model="meta-llama/llama-4-scout-17b-16e-instruct", # Using vision model
                             messages=messages,
                             temperature=0.7,
@@ -2857,7 +3833,7 @@ async def api_narrate_single_page(project_id: str, page_number: int, payload: Di
 
              # Azure Single Attempt with Force Truncate
              try:
-                 completion = client.chat.completions.create(
+                 completion = await asyncio.to_thread(client.chat.completions.create,
                         model="gpt-5-nano",
                         messages=msgs_to_send,
                         max_completion_tokens=25000,
@@ -2894,7 +3870,7 @@ async def api_narrate_single_page(project_id: str, page_number: int, payload: Di
             if genai is None:
                  raise HTTPException(status_code=400, detail="Gemini lib not installed")
             
-            contents = _build_page_prompt(int(page_number), imgs, context_txt, char_md)
+            contents = await asyncio.to_thread(_build_page_prompt, int(page_number), imgs, context_txt, char_md)
             model = _gemini_client()
             if not model:
                  raise HTTPException(status_code=500, detail="Gemini client init failed")
@@ -2905,7 +3881,7 @@ async def api_narrate_single_page(project_id: str, page_number: int, payload: Di
 
             for attempt in range(3):
                 try:
-                     resp = model.generate_content(contents)
+                     resp = await asyncio.to_thread(model.generate_content, contents)
                      txt = resp.text
                      try:
                         extracted = json.loads(txt)
@@ -2966,38 +3942,21 @@ async def api_narrate_single_page(project_id: str, page_number: int, payload: Di
             for i in range(1, num_panels + 1):
                 combined = " ".join(merged.get(i) or [])
                 if combined:
-                    EditorDB.upsert_panel_narration(project_id, int(page_number), i, combined)
                     out.append({"panel_index": i, "text": combined})
-            # Cleanup any legacy rows without images on this page
-            try:
-                EditorDB.conn().execute(
-                    "DELETE FROM panels WHERE project_id=? AND page_number=? AND (image_path IS NULL OR image_path='')",
-                    (project_id, int(page_number)),
-                )
-                EditorDB.conn().commit()
-            except Exception:
-                pass
         else:
             # fallback assignment in order
-            segs = [s.strip() for s in (txt or "").split(".") if s.strip()]
+            segs = _SENT_RE.findall(txt or "")
             if len(panels) == 1:
                 combined = (". ".join(segs).strip() + ".") if segs else ""
-                EditorDB.upsert_panel_narration(project_id, int(page_number), 1, combined)
                 out.append({"panel_index": 1, "text": combined})
             else:
                 for idx1 in range(1, len(panels) + 1):
                     t = (segs[idx1 - 1] + ".") if (idx1 - 1) < len(segs) else ""
-                    EditorDB.upsert_panel_narration(project_id, int(page_number), idx1, t)
                     out.append({"panel_index": idx1, "text": t})
-            # Cleanup any legacy rows without images on this page
-            try:
-                EditorDB.conn().execute(
-                    "DELETE FROM panels WHERE project_id=? AND page_number=? AND (image_path IS NULL OR image_path='')",
-                    (project_id, int(page_number)),
-                )
-                EditorDB.conn().commit()
-            except Exception:
-                pass
+        # One transaction for the page; also cleans up legacy rows without images
+        await _db_call(
+            EditorDB.set_page_narrations, project_id, int(page_number), [(o["panel_index"], o["text"]) for o in out], purge_imageless=True
+        )
 
         return {"ok": True, "page_number": int(page_number), "panels": out}
     except HTTPException:
@@ -3011,7 +3970,7 @@ async def api_narrate_single_page(project_id: str, page_number: int, payload: Di
 async def api_save_manual_narration(project_id: str, page_number: int, payload: Dict[str, Any]):
     """Manually save narration for panels on a page (when AI generation is blocked or user wants manual control)"""
     try:
-        project = EditorDB.get_project(project_id)
+        project = await _db_call(EditorDB.get_project, project_id)
         if not project:
             raise HTTPException(status_code=404, detail="Project not found")
         
@@ -3025,8 +3984,10 @@ async def api_save_manual_narration(project_id: str, page_number: int, payload:
             text = panel_item.get("text", "").strip()
             
             if panel_index is not None:
-                EditorDB.upsert_panel_narration(project_id, int(page_number), int(panel_index), text, is_manual=True)
                 saved_panels.append({"panel_index": int(panel_index), "text": text})
+        await _db_call(
+            EditorDB.set_page_narrations, project_id, int(page_number), [(o["panel_index"], o["text"]) for o in saved_panels], is_manual=True
+        )
         
         return {"ok": True, "page_number": int(page_number), "panels": saved_panels}
     except HTTPException:
@@ -3202,12 +4163,7 @@ async def api_update_characters_from_narrations(project_id: str):
     narr = EditorDB.get_panel_narrations(project_id)
     if not narr:
         raise HTTPException(status_code=400, detail="No narrations found to build character list")
-    # Create a compact context
-    items = []
-    # sort by page/panel
-    for (pg, idx), text in sorted(narr.items(), key=lambda x: (x[0][0], x[0][1])):
-        items.append(f"Page {pg} Panel {idx}: {text}")
-    corpus = "\n".join(items)
+    corpus = _narration_corpus(narr)
 
     prompt = (
         "Extract a character list from the following manga panel narrations. "
@@ -3352,7 +4308,8 @@ async def api_update_characters_from_narrations(project_id: str):
             raise HTTPException(status_code=500, detail="Failed to initialize Gemini client")
         
         try:
-            resp = model.generate_content(prompt)
+            # Blocking SDK call: run it off the event loop
+            resp = await asyncio.to_thread(model.generate_content, prompt)
             md = resp.text or ""
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Gemini error: {e}")
@@ -3401,11 +4358,7 @@ async def api_generate_story_summary(project_id: str):
     if not narr:
         raise HTTPException(status_code=400, detail="No narrations found to generate story summary")
 
-    # Create a compact context, sorted by page/panel
-    items = []
-    for (pg, idx), text in sorted(narr.items(), key=lambda x: (x[0][0], x[0][1])):
-        items.append(f"Page {pg} Panel {idx}: {text}")
-    corpus = "\n".join(items)
+    corpus = _narration_corpus(narr)
 
     prompt = (
         "Based on the following manga panel narrations, generate a cohesive story summary. "
@@ -3436,7 +4389,8 @@ async def api_generate_story_summary(project_id: str):
             raise HTTPException(status_code=500, detail="Failed to initialize Gemini client")
 
         try:
-            resp = model.generate_content(prompt)
+            # Blocking SDK call: run it off the event loop
+            resp = await asyncio.to_thread(model.generate_content, prompt)
             summary = resp.text or ""
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Gemini error: {e}")
@@ -3590,13 +4544,9 @@ async def api_get_narration_status(series_id: str, override: bool = False):
             chapters_without_panels.append(chapter_info)
             continue
             
-        has_all_panels = True
-        for pg in pages:
-            pn = int(pg.get("page_number") or 0)
-            panels = EditorDB.get_panels_for_page(ch["id"], pn)
-            if not panels:
-                has_all_panels = False
-                break
+        # One query for the whole chapter instead of one per page
+        panels_by_page = EditorDB.get_panels_for_project(ch["id"])
+        has_all_panels = all(int(pg.get("page_number") or 0) in panels_by_page for pg in pages)
         
         if not has_all_panels:
             chapters_without_panels.append(chapter_info)
@@ -3738,13 +4688,8 @@ async def api_narrate_all_series_chapters_execute(series_id: str, payload: Dict[
                 continue
             
             # Check if chapter has panels
-            all_have_panels = True
-            for pg in pages:
-                pn = int(pg.get("page_number") or 0)
-                panels = EditorDB.get_panels_for_page(chapter_id, pn)
-                if not panels:
-                    all_have_panels = False
-                    break
+            panels_by_page = EditorDB.get_panels_for_project(chapter_id)
+            all_have_panels = all(int(pg.get("page_number") or 0) in panels_by_page for pg in pages)
             
             if not all_have_panels:
                 failed_count += 1
@@ -3881,35 +4826,11 @@ async def api_delete_manga_series(series_id: str, delete_chapters: bool = False)
 async def api_migrate_samurai_projects():
     """Migrate existing Samurai projects into a proper manga series structure."""
     try:
-        # Create "Samurai" series
-        series = EditorDB.create_manga_series("Samurai")
-        series_id = series["id"]
-        
-        # Find "Samurai" and "Samurai Chapter 2" projects
-        conn = EditorDB.conn()
-        projects = conn.execute(
-            "SELECT id, title FROM project_details WHERE title LIKE '%Samurai%' ORDER BY created_at ASC"
-        ).fetchall()
-        
-        migrated = []
-        for idx, proj in enumerate(projects):
-            proj_id = proj[0]
-            title = proj[1]
-            
-            # Determine chapter number based on title
-            chapter_num = idx + 1
-            if "Chapter 2" in title or "chapter 2" in title:
-                chapter_num = 2
-            elif "Chapter" not in title and "chapter" not in title:
-                chapter_num = 1
-            
-            # Migrate project
-            EditorDB.update_chapter_series_info(proj_id, series_id, chapter_num)
-            migrated.append({
-                "project_id": proj_id,
-                "title": title,
-                "chapter_number": chapter_num
-            })
+        # Create the "Samurai" series and move "Samurai" / "Samurai Chapter 2" into it in one commit
+        with EditorDB.transaction():
+            series = EditorDB.create_manga_series("Samurai")
+            series_id = series["id"]
+            migrated = EditorDB.assign_series_by_title(series_id, "Samurai")
         
         return {
             "ok": True,
@@ -3963,6 +4884,11 @@ async def panel_editor_full(request: Request, project_id: str):
     proj = EditorDB.get_project(project_id)
     if not proj:
         raise HTTPException(status_code=404, detail="Project not found")
+    # Drop legacy image-less panel rows once per editor load instead of on every panel edit
+    try:
+        await _db_call(EditorDB.cleanup_orphan_panels, project_id)
+    except Exception:
+        logger.exception("Orphan panel cleanup failed for %s", project_id)
     return templates.TemplateResponse(
         "panel_editor_full.html",
         {"request": request, "project": proj},
@@ -3971,40 +4897,28 @@ async def panel_editor_full(request: Request, project_id: str):
 
 @router.put("/api/project/{project_id:path}/panel/{page_number}/{panel_index}/text")
 async def api_update_panel_text(project_id: str, page_number: int, panel_index: int, payload: Dict[str, Any]):
-    proj = EditorDB.get_project(project_id)
-    if not proj:
+    num = await _db_call(EditorDB.get_page_panel_count, project_id, int(page_number))
+    if num is None:
         raise HTTPException(status_code=404, detail="Project not found")
-    panels = EditorDB.get_panels_for_page(project_id, int(page_number))
-    if not panels:
+    if not num:
         raise HTTPException(status_code=404, detail="No panels for this page")
     text = str(payload.get("text") or "").strip()
     # Clamp to valid panel indices; overflow goes to 1 as per UI convention
-    num = len(panels)
     idx = int(panel_index)
     if idx <= 0:
         idx = 1
     if idx > num:
         idx = 1
-    EditorDB.upsert_panel_narration(project_id, int(page_number), idx, text)
-    # Cleanup any legacy rows without images
-    try:
-        EditorDB.conn().execute(
-            "DELETE FROM panels WHERE project_id=? AND page_number=? AND (image_path IS NULL OR image_path='')",
-            (project_id, int(page_number)),
-        )
-        EditorDB.conn().commit()
-    except Exception:
-        pass
+    await _db_call(EditorDB.upsert_panel_narration, project_id, int(page_number), idx, text)
     return {"ok": True, "page_number": int(page_number), "panel_index": idx, "text": text}
 
 
 @router.put("/api/project/{project_id:path}/panel/{page_number}/{panel_index}/audio")
 async def api_update_panel_audio(project_id: str, page_number: int, panel_index: int, payload: Dict[str, Any]):
-    proj = EditorDB.get_project(project_id)
-    if not proj:
+    num = await _db_call(EditorDB.get_page_panel_count, project_id, int(page_number))
+    if num is None:
         raise HTTPException(status_code=404, detail="Project not found")
-    panels = EditorDB.get_panels_for_page(project_id, int(page_number))
-    if not panels:
+    if not num:
         raise HTTPException(status_code=404, detail="No panels for this page")
     # Accept either a data URL/base64 string or a URL to uploads
     audio_b64_legacy = str(payload.get("audioB64") or "").strip()
@@ -4012,7 +4926,6 @@ async def api_update_panel_audio(project_id: str, page_number: int, panel_index:
     if not audio_b64_legacy and not audio_url:
         raise HTTPException(status_code=400, detail="audioB64 or audioUrl is required")
     # Clamp panel index
-    num = len(panels)
     idx = int(panel_index)
     if idx <= 0:
         idx = 1
@@ -4020,155 +4933,101 @@ async def api_update_panel_audio(project_id: str, page_number: int, panel_index:
         idx = 1
     # Store whichever string we have; consumer can interpret
     val = audio_url or audio_b64_legacy
-    EditorDB.set_panel_audio(project_id, int(page_number), idx, val)
-    try:
-        EditorDB.conn().execute(
-            "DELETE FROM panels WHERE project_id=? AND page_number=? AND (image_path IS NULL OR image_path='')",
-            (project_id, int(page_number)),
-        )
-        EditorDB.conn().commit()
-    except Exception:
-        pass
+    await _db_call(EditorDB.set_panel_audio, project_id, int(page_number), idx, val)
     return {"ok": True, "page_number": int(page_number), "panel_index": idx}
 
 
 @router.put("/api/project/{project_id:path}/panel/{page_number}/{panel_index}/config")
 async def api_update_panel_config(project_id: str, page_number: int, panel_index: int, payload: Dict[str, Any]):
-    proj = EditorDB.get_project(project_id)
-    if not proj:
+    num = await _db_call(EditorDB.get_page_panel_count, project_id, int(page_number))
+    if num is None:
         raise HTTPException(status_code=404, detail="Project not found")
-    panels = EditorDB.get_panels_for_page(project_id, int(page_number))
-    if not panels:
+    if not num:
         raise HTTPException(status_code=404, detail="No panels for this page")
     eff = str(payload.get("effect") or "").strip() or "zoom_in"
     trans = str(payload.get("transition") or "").strip() or "slide_book"
     # Clamp panel index
-    num = len(panels)
     idx = int(panel_index)
     if idx <= 0:
         idx = 1
     if idx > num:
         idx = 1
-    EditorDB.set_panel_config(project_id, int(page_number), idx, eff, trans)
+    await _db_call(EditorDB.set_panel_config, project_id, int(page_number), idx, eff, trans)
     return {"ok": True, "page_number": int(page_number), "panel_index": idx, "effect": eff, "transition": trans}
 
 
 @router.delete("/api/project/{project_id}/panel/{page_number}/{panel_index}")
 async def api_delete_panel(project_id: str, page_number: int, panel_index: int):
     """Delete a specific panel and re-index remaining panels on that page."""
-    conn = EditorDB.conn()
-    
-    # Check if panel exists
-    row = conn.execute(
-        "SELECT 1 FROM panels WHERE project_id=? AND page_number=? AND panel_index=?",
-        (project_id, page_number, panel_index)
-    ).fetchone()
-    if not row:
+    remaining = await _db_call(EditorDB.delete_panel, project_id, page_number, panel_index)
+    if remaining is None:
         raise HTTPException(status_code=404, detail="Panel not found")
-        
-    # Get all panels for this page before deletion
-    rows = conn.execute(
-        "SELECT panel_index, image_path, narration_text, is_manual, audio_url, effect, transition FROM panels WHERE project_id=? AND page_number=? ORDER BY panel_index ASC",
-        (project_id, page_number)
-    ).fetchall()
-    
-    # Filter out the deleted panel
-    remaining = [r for r in rows if int(r[0]) != panel_index]
-    
-    # Delete all panels for this page
-    conn.execute(
-        "DELETE FROM panels WHERE project_id=? AND page_number=?",
-        (project_id, page_number)
-    )
-    
-    # Re-insert with new sequential indices
-    for i, r in enumerate(remaining):
-        new_index = i + 1
-        # r: (panel_index, image_path, narration_text, is_manual, audio_url, effect, transition)
-        conn.execute(
-            """
-            INSERT INTO panels (project_id, page_number, panel_index, image_path, narration_text, is_manual, audio_url, effect, transition, created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                project_id, page_number, new_index, 
-                r[1], r[2], r[3], r[4], r[5], r[6], 
-                datetime.now().isoformat(), datetime.now().isoformat()
-            )
-        )
-        
-    conn.commit()
-    return {"status": "ok", "remaining_panels": len(remaining)}
+    return {"status": "ok", "remaining_panels": remaining}
 
 
 @router.put("/api/project/{project_id:path}/page/{page_number}/config")
 async def api_update_page_config(project_id: str, page_number: int, payload: Dict[str, Any]):
     """Apply effect/transition to all panels on a page."""
-    proj = EditorDB.get_project(project_id)
-    if not proj:
+    indices = await _db_call(EditorDB.get_page_panel_indices, project_id, int(page_number))
+    if indices is None:
         raise HTTPException(status_code=404, detail="Project not found")
-    panels = EditorDB.get_panels_for_page(project_id, int(page_number))
-    if not panels:
+    if not indices:
         raise HTTPException(status_code=404, detail="No panels for this page")
     eff = str(payload.get("effect") or "").strip() or "zoom_in"
     trans = str(payload.get("transition") or "").strip() or "slide_book"
-    for p in panels:
-        idx = int(p.get("index") or 1)
-        EditorDB.set_panel_config(project_id, int(page_number), idx, eff, trans)
-    return {"ok": True, "page_number": int(page_number), "count": len(panels), "effect": eff, "transition": trans}
+    # Exactly the panels that have an image; legacy image-less rows may sit among them
+    await _db_call(
+        EditorDB.set_panel_configs_bulk,
+        project_id, int(page_number), [(idx, eff, trans) for idx in indices]
+    )
+    return {"ok": True, "page_number": int(page_number), "count": len(indices), "effect": eff, "transition": trans}
+
+
+@router.put("/api/project/{project_id:path}/page/{page_number}/texts")
+async def api_update_page_texts(project_id: str, page_number: int, payload: Dict[str, Any]):
+    """Save the narration text of several panels on a page in one transaction.
+
+    Body: {"panels": [{"panel_index": 1, "text": "..."}, ...]}; indices are clamped
+    the same way as the per-panel text route.
+    """
+    items = payload.get("panels")
+    if not isinstance(items, list):
+        raise HTTPException(status_code=400, detail="panels must be an array")
+    for i, item in enumerate(items):
+        if not isinstance(item, dict):
+            raise HTTPException(status_code=400, detail=f"panels[{i}] must be an object")
+        pi = item.get("panel_index")
+        if not isinstance(pi, int) or isinstance(pi, bool):
+            raise HTTPException(status_code=400, detail=f"panels[{i}].panel_index must be an integer")
+    num = await _db_call(EditorDB.get_page_panel_count, project_id, int(page_number))
+    if num is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+    if not num:
+        raise HTTPException(status_code=404, detail="No panels for this page")
+    texts: List[Tuple[int, str]] = []
+    for item in items:
+        idx = item["panel_index"]
+        if idx <= 0 or idx > num:
+            idx = 1
+        texts.append((idx, str(item.get("text") or "").strip()))
+    await _db_call(EditorDB.set_page_narrations, project_id, int(page_number), texts)
+    return {"ok": True, "page_number": int(page_number), "count": len(texts)}
 
 
 @router.delete("/api/project/{project_id:path}/page/{page_number}")
 async def api_delete_page(project_id: str, page_number: int):
     """Delete a page and its panels from the project, then auto-renumber remaining pages sequentially."""
-    proj = EditorDB.get_project(project_id)
+    proj = await _db_call(EditorDB.get_project, project_id)
     if not proj:
         raise HTTPException(status_code=404, detail="Project not found")
     
     try:
-        # Get current pages
-        pages_json = proj.get("pages") or []
-        
-        # Remove the page with matching page_number
-        updated_pages = [p for p in pages_json if p.get("page_number") != page_number]
-        
-        if len(updated_pages) == len(pages_json):
+        remaining = await _db_call(EditorDB.delete_page, project_id, page_number)
+        if remaining is None:
             raise HTTPException(status_code=404, detail="Page not found")
         
-        # Sort by current page_number to maintain order
-        updated_pages.sort(key=lambda x: x.get("page_number", 0))
-        
-        # Renumber pages sequentially (1, 2, 3, ...)
-        for idx, page in enumerate(updated_pages, start=1):
-            page["page_number"] = idx
-        
-        # Update database
-        conn = EditorDB.conn()
-        conn.execute(
-            "UPDATE project_details SET pages_json=? WHERE id=?",
-            (json.dumps(updated_pages), project_id)
-        )
-        conn.commit()
-        
-        # Also delete panel data for this page and renumber metadata pages
-        metadata = json.loads(proj.get("metadata") or "{}")
-        if "pages" in metadata:
-            # Remove deleted page from metadata
-            metadata["pages"] = [p for p in metadata["pages"] if p.get("page_number") != page_number]
-            
-            # Sort and renumber metadata pages
-            metadata["pages"].sort(key=lambda x: x.get("page_number", 0))
-            for idx, page in enumerate(metadata["pages"], start=1):
-                page["page_number"] = idx
-            
-            conn.execute(
-                "UPDATE project_details SET metadata_json=? WHERE id=?",
-                (json.dumps(metadata), project_id)
-            )
-            conn.commit()
-        
-        logger.info(f"Deleted page {page_number} from project {project_id}, renumbered {len(updated_pages)} remaining pages")
-        return {"ok": True, "deleted_page": page_number, "remaining_pages": len(updated_pages), "renumbered": True}
+        logger.info(f"Deleted page {page_number} from project {project_id}, renumbered {remaining} remaining pages")
+        return {"ok": True, "deleted_page": page_number, "remaining_pages": remaining, "renumbered": True}
         
     except HTTPException:
         raise
@@ -4180,7 +5039,7 @@ async def api_delete_page(project_id: str, page_number: int):
 @router.post("/api/project/{project_id:path}/reorder-pages")
 async def api_reorder_pages(project_id: str, payload: Dict[str, Any]):
     """Reorder pages in the project."""
-    proj = EditorDB.get_project(project_id)
+    proj = await _db_call(EditorDB.get_project, project_id)
     if not proj:
         raise HTTPException(status_code=404, detail="Project not found")
     
@@ -4189,44 +5048,10 @@ async def api_reorder_pages(project_id: str, payload: Dict[str, Any]):
         raise HTTPException(status_code=400, detail="Pages array is required")
     
     try:
-        # Get current pages and metadata
-        current_pages = proj.get("pages") or []
-        metadata = json.loads(proj.get("metadata") or "{}")
-        
-        # Create a mapping of old page numbers to new page numbers
-        page_number_map = {}
-        for idx, new_page in enumerate(new_pages):
-            old_page = current_pages[idx] if idx < len(current_pages) else None
-            if old_page:
-                old_page_number = old_page.get("page_number")
-                new_page_number = new_page.get("page_number")
-                page_number_map[old_page_number] = new_page_number
-        
-        # Update pages_json with new page numbers
-        updated_pages = []
-        for idx, new_page in enumerate(new_pages):
-            if idx < len(current_pages):
-                page = current_pages[idx].copy()
-                page["page_number"] = new_page.get("page_number")
-                updated_pages.append(page)
-        
-        # Update metadata pages with new page numbers
-        if "pages" in metadata:
-            for meta_page in metadata["pages"]:
-                old_num = meta_page.get("page_number")
-                if old_num in page_number_map:
-                    meta_page["page_number"] = page_number_map[old_num]
-        
-        # Save to database
-        conn = EditorDB.conn()
-        conn.execute(
-            "UPDATE project_details SET pages_json=?, metadata_json=? WHERE id=?",
-            (json.dumps(updated_pages), json.dumps(metadata), project_id)
-        )
-        conn.commit()
+        pages_count = await _db_call(EditorDB.reorder_pages, project_id, new_pages)
         
-        logger.info(f"Reordered {len(updated_pages)} pages for project {project_id}")
-        return {"ok": True, "pages_count": len(updated_pages)}
+        logger.info(f"Reordered {pages_count} pages for project {project_id}")
+        return {"ok": True, "pages_count": pages_count}
         
     except Exception as e:
         logger.error(f"Error reordering pages: {e}", exc_info=True)
@@ -4234,33 +5059,70 @@ async def api_reorder_pages(project_id: str, payload: Dict[str, Any]):
 
 
 # ---------------------------- TTS synthesis (DB-backed) ----------------------------
-@router.post("/api/project/{project_id:path}/tts/synthesize/page/{page_number}")
-async def api_tts_synthesize_page(project_id: str, page_number: int, payload: Dict[str, Any] = Body(default={})):
-    """Synthesize TTS for all panels on a page.
-    Payload: { overwrite: bool }
-    """
-    if not TTS_API_URL:
-        raise HTTPException(status_code=503, detail="TTS API not configured (TTS_API_URL)")
+# Max concurrent requests to the TTS server while synthesizing a page
+_TTS_CONCURRENCY = 8
 
-    overwrite = bool(payload.get("overwrite", False))
+# One keep-alive client for every TTS request, so panels reuse connections (and TLS
+# sessions) to the TTS server instead of reconnecting per request. Created lazily inside
+# the server's event loop and closed on shutdown.
+_tts_client: Optional[httpx.AsyncClient] = None
 
-    proj = EditorDB.get_project(project_id)
-    if not proj:
-        raise HTTPException(status_code=404, detail="Project not found")
 
-    panels = EditorDB.get_panels_for_page(project_id, int(page_number))
-    if not panels:
-        raise HTTPException(status_code=404, detail="No panels for this page")
+def _get_tts_client() -> httpx.AsyncClient:
+    global _tts_client
+    if _tts_client is None or _tts_client.is_closed:
+        _tts_client = httpx.AsyncClient(
+            timeout=60.0,
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=16),
+        )
+    return _tts_client
+
+
+async def _close_tts_client() -> None:
+    global _tts_client
+    if _tts_client is not None:
+        await _tts_client.aclose()
+        _tts_client = None
+
+
+router.on_shutdown.append(_close_tts_client)
 
+
+def _tts_headers() -> Dict[str, str]:
+    """Optional API key header for the TTS provider (TTS_API_KEY / TTS_API_KEY_HEADER)."""
+    tts_headers: Dict[str, str] = {}
+    tts_key = os.environ.get("TTS_API_KEY", "").strip()
+    tts_key_header = os.environ.get("TTS_API_KEY_HEADER", "Authorization").strip()
+    if tts_key:
+        # If header is Authorization and value doesn't start with Bearer, prefix it
+        if tts_key_header.lower() == "authorization" and not tts_key.lower().startswith("bearer "):
+            tts_headers[tts_key_header] = f"Bearer {tts_key}"
+        else:
+            tts_headers[tts_key_header] = tts_key
+    return tts_headers
+
+
+async def _synth_page(
+    project_id: str,
+    page_number: int,
+    panels: List[Dict[str, Any]],
+    overwrite: bool,
+    client: httpx.AsyncClient,
+    sem: asyncio.Semaphore,
+) -> Dict[str, Any]:
+    """Synthesize TTS for the panels of one page and return the page endpoint's response body.
+
+    Panels are independent and synthesized concurrently; sem bounds the requests in flight
+    against the TTS server and may be shared by several pages.
+    """
     # Ensure output directory exists
     project_dir = os.path.join(MANGA_DIR, project_id)
     out_dir = os.path.join(project_dir, "tts")
-    os.makedirs(out_dir, exist_ok=True)
+    _ensure_dir(out_dir)
 
-    created = 0
-    results: List[Dict[str, Any]] = []
+    tts_headers = _tts_headers()
 
-    for p in panels:
+    async def synth_one(p: Dict[str, Any]) -> Dict[str, Any]:
         try:
             idx = int(p.get("index") or 1)
         except Exception:
@@ -4269,24 +5131,22 @@ async def api_tts_synthesize_page(project_id: str, page_number: int, payload: Di
         # Check if audio already exists
         existing_audio = p.get("audio") or p.get("audio_url")
         if existing_audio and not overwrite:
-            results.append({
+            return {
                 "panel_index": idx,
                 "text": p.get("text", ""),
                 "audio_url": existing_audio,
                 "status": "skipped_exists"
-            })
-            continue
+            }
 
         text = str(p.get("text") or "").strip()
         if not text:
             # Nothing to synthesize; keep existing audio if any
-            results.append({
+            return {
                 "panel_index": idx,
                 "text": "",
                 "audio_url": existing_audio,
                 "status": "skipped_empty"
-            })
-            continue
+            }
 
         try:
             tts_payload = {
@@ -4295,18 +5155,7 @@ async def api_tts_synthesize_page(project_id: str, page_number: int, payload: Di
                 "cfg_weight": "0.5",
                 "temperature": "0.8",
             }
-            # Allow optional API key header for TTS provider
-            tts_headers = {}
-            tts_key = os.environ.get("TTS_API_KEY", "").strip()
-            tts_key_header = os.environ.get("TTS_API_KEY_HEADER", "Authorization").strip()
-            if tts_key:
-                # If header is Authorization and value doesn't start with Bearer, prefix it
-                if tts_key_header.lower() == "authorization" and not tts_key.lower().startswith("bearer "):
-                    tts_headers[tts_key_header] = f"Bearer {tts_key}"
-                else:
-                    tts_headers[tts_key_header] = tts_key
-
-            async with httpx.AsyncClient(timeout=60.0) as client:
+            async with sem:
                 r = await client.post(TTS_API_URL, data=tts_payload, headers=tts_headers or None)
             if r.status_code != 200:
                 # Log provider response for easier debugging (trim to 2k chars)
@@ -4315,39 +5164,39 @@ async def api_tts_synthesize_page(project_id: str, page_number: int, payload: Di
                 except Exception:
                     body = "<unreadable>"
                 logger.warning("TTS provider returned %s for project %s page %s panel %s: %s", r.status_code, project_id, page_number, idx, (body[:2000] if body else ""))
-                results.append({
+                return {
                     "panel_index": idx,
                     "text": text,
                     "audio_url": None,
                     "status": f"error:{r.status_code}"
-                })
-                continue
+                }
 
             # Save audio
             fname = f"tts_page_{int(page_number)}_panel_{idx}.wav"
             abs_path = os.path.join(out_dir, fname)
-            with open(abs_path, "wb") as wf:
-                wf.write(r.content)
+            await asyncio.to_thread(_dump, abs_path, r.content)
             url = f"/manga_projects/{project_id}/tts/{fname}"
 
             # Persist to DB (store URL string in audio_b64 column)
-            EditorDB.set_panel_audio(project_id, int(page_number), idx, url)
+            await _db_call(EditorDB.set_panel_audio, project_id, int(page_number), idx, url)
 
-            created += 1
-            results.append({
+            return {
                 "panel_index": idx,
                 "text": text,
                 "audio_url": url,
                 "status": "ok"
-            })
+            }
         except Exception as e:
             logger.exception("TTS failed for page %s panel %s", page_number, idx)
-            results.append({
+            return {
                 "panel_index": idx,
                 "text": text,
                 "audio_url": None,
                 "status": f"exception:{e}"
-            })
+            }
+
+    results: List[Dict[str, Any]] = list(await asyncio.gather(*(synth_one(p) for p in panels)))
+    created = sum(1 for r in results if r["status"] == "ok")
 
     return {
         "ok": True,
@@ -4357,6 +5206,27 @@ async def api_tts_synthesize_page(project_id: str, page_number: int, payload: Di
     }
 
 
+@router.post("/api/project/{project_id:path}/tts/synthesize/page/{page_number}")
+async def api_tts_synthesize_page(project_id: str, page_number: int, payload: Dict[str, Any] = Body(default={})):
+    """Synthesize TTS for all panels on a page.
+    Payload: { overwrite: bool }
+    """
+    if not TTS_API_URL:
+        raise HTTPException(status_code=503, detail="TTS API not configured (TTS_API_URL)")
+
+    overwrite = bool(payload.get("overwrite", False))
+
+    proj = await _db_call(EditorDB.get_project, project_id)
+    if not proj:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    panels = await _db_call(EditorDB.get_panels_for_page, project_id, int(page_number))
+    if not panels:
+        raise HTTPException(status_code=404, detail="No panels for this page")
+
+    return await _synth_page(project_id, int(page_number), panels, overwrite, _get_tts_client(), asyncio.Semaphore(_TTS_CONCURRENCY))
+
+
 @router.post("/api/project/{project_id:path}/tts/synthesize/page/{page_number}/panel/{panel_index}")
 async def api_tts_synthesize_panel(project_id: str, page_number: int, panel_index: int):
     """Synthesize TTS for a single panel on a page using narration_text stored in DB.
@@ -4366,11 +5236,11 @@ async def api_tts_synthesize_panel(project_id: str, page_number: int, panel_inde
     if not TTS_API_URL:
         raise HTTPException(status_code=503, detail="TTS API not configured (TTS_API_URL)")
 
-    proj = EditorDB.get_project(project_id)
+    proj = await _db_call(EditorDB.get_project, project_id)
     if not proj:
         raise HTTPException(status_code=404, detail="Project not found")
 
-    panels = EditorDB.get_panels_for_page(project_id, int(page_number))
+    panels = await _db_call(EditorDB.get_panels_for_page, project_id, int(page_number))
     if not panels:
         raise HTTPException(status_code=404, detail="No panels for this page")
 
@@ -4384,23 +5254,13 @@ async def api_tts_synthesize_panel(project_id: str, page_number: int, panel_inde
         except Exception:
             continue
 
-    if target is None:
-        # try fallback: maybe stored as 0-based in DB
-        for p in panels:
-            try:
-                if int(p.get("index") or 0) == int(panel_index) - 1:
-                    target = p
-                    break
-            except Exception:
-                continue
-
     if target is None:
         raise HTTPException(status_code=404, detail="Panel not found")
 
     text = str(target.get("text") or "").strip()
     project_dir = os.path.join(MANGA_DIR, project_id)
     out_dir = os.path.join(project_dir, "tts")
-    os.makedirs(out_dir, exist_ok=True)
+    _ensure_dir(out_dir)
 
     if not text:
         # nothing to synthesize; return existing audio or skipped
@@ -4422,18 +5282,9 @@ async def api_tts_synthesize_panel(project_id: str, page_number: int, panel_inde
             "cfg_weight": "0.5",
             "temperature": "0.8",
         }
-        # Optional API key header support for TTS provider
-        tts_headers = {}
-        tts_key = os.environ.get("TTS_API_KEY", "").strip()
-        tts_key_header = os.environ.get("TTS_API_KEY_HEADER", "Authorization").strip()
-        if tts_key:
-            if tts_key_header.lower() == "authorization" and not tts_key.lower().startswith("bearer "):
-                tts_headers[tts_key_header] = f"Bearer {tts_key}"
-            else:
-                tts_headers[tts_key_header] = tts_key
+        tts_headers = _tts_headers()
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            r = await client.post(TTS_API_URL, data=payload, headers=tts_headers or None)
+        r = await _get_tts_client().post(TTS_API_URL, data=payload, headers=tts_headers or None)
         if r.status_code != 200:
             try:
                 body = r.text
@@ -4445,12 +5296,11 @@ async def api_tts_synthesize_panel(project_id: str, page_number: int, panel_inde
         # Save audio
         fname = f"tts_page_{int(page_number)}_panel_{int(panel_index)}.wav"
         abs_path = os.path.join(out_dir, fname)
-        with open(abs_path, "wb") as wf:
-            wf.write(r.content)
+        await asyncio.to_thread(_dump, abs_path, r.content)
         url = f"/manga_projects/{project_id}/tts/{fname}"
 
         # Persist to DB
-        EditorDB.set_panel_audio(project_id, int(page_number), int(panel_index), url)
+        await _db_call(EditorDB.set_panel_audio, project_id, int(page_number), int(panel_index), url)
 
         return {
             "ok": True,
@@ -4471,45 +5321,67 @@ async def api_tts_synthesize_panel(project_id: str, page_number: int, panel_inde
 
 @router.post("/api/project/{project_id:path}/tts/synthesize/all")
 async def api_tts_synthesize_all(project_id: str, payload: Dict[str, Any] = Body(default={})):
-    """Synthesize TTS for all pages in the project sequentially.
+    """Synthesize TTS for all pages in the project, pages and panels concurrently.
     Payload: { overwrite: bool }
     """
     if not TTS_API_URL:
         raise HTTPException(status_code=503, detail="TTS API not configured (TTS_API_URL)")
 
-    proj = EditorDB.get_project(project_id)
+    proj = await _db_call(EditorDB.get_project, project_id)
     if not proj:
         raise HTTPException(status_code=404, detail="Project not found")
 
-    pages = EditorDB.get_pages(project_id)
+    pages = await _db_call(EditorDB.get_pages, project_id)
     if not pages:
         raise HTTPException(status_code=400, detail="Project has no pages")
     
-    # We pass the same payload (overwrite flag) to the page endpoint
-    pass_payload = payload or {}
-
-    total_created = 0
-    page_summaries: List[Dict[str, Any]] = []
-    for pg in pages:
-        pn = int(pg.get("page_number") or 0)
+    overwrite = bool((payload or {}).get("overwrite", False))
+    # One query for every page's panels
+    panels_by_page = await _db_call(EditorDB.get_panels_for_project, project_id)
+    # Shared by all pages: bounds the total TTS requests in flight, not per page
+    sem = asyncio.Semaphore(_TTS_CONCURRENCY)
+
+    async def run(client: httpx.AsyncClient, pn: int) -> Dict[str, Any]:
+        panels = panels_by_page.get(pn)
+        if not panels:
+            return {"page_number": pn, "ok": False, "error": "No panels for this page"}
         try:
-            res = await api_tts_synthesize_page(project_id, pn, payload=pass_payload)
-            total_created += int(res.get("created", 0))
-            page_summaries.append({"page_number": pn, **res})
-        except HTTPException as e:
-            page_summaries.append({"page_number": pn, "ok": False, "error": e.detail})
+            res = await _synth_page(project_id, pn, panels, overwrite, client, sem)
+            return {"page_number": pn, **res}
         except Exception as e:
-            page_summaries.append({"page_number": pn, "ok": False, "error": str(e)})
+            return {"page_number": pn, "ok": False, "error": str(e)}
+
+    client = _get_tts_client()
+    page_summaries: List[Dict[str, Any]] = list(await asyncio.gather(
+        *(run(client, int(pg.get("page_number") or 0)) for pg in pages)
+    ))
+    total_created = sum(int(ps.get("created", 0)) for ps in page_summaries)
 
     return {"ok": True, "total_created": int(total_created), "pages": page_summaries}
 
 
+# TTS clips written by the TTS endpoints: tts_page_<page>_panel_<index>.wav
+_TTS_FILE_RE = re.compile(r"tts_page_(\d+)_panel_(\d+)\.wav$", re.IGNORECASE)
+
+
+def _scan_tts_dir(project_id: str, tts_dir: str) -> List[Tuple[int, int, str]]:
+    """(page_number, panel_index, url) for every TTS clip in tts_dir, in one scandir pass."""
+    rows: List[Tuple[int, int, str]] = []
+    with os.scandir(tts_dir) as it:
+        for entry in it:
+            m = _TTS_FILE_RE.match(entry.name)
+            if not m or not entry.is_file():
+                continue
+            rows.append((int(m.group(1)), int(m.group(2)), f"/manga_projects/{project_id}/tts/{entry.name}"))
+    return rows
+
+
 @router.post("/api/project/{project_id:path}/tts/backfill")
 async def api_tts_backfill_urls(project_id: str):
     """Backfill audio URL entries in DB from files on disk under /manga_projects/{project_id}/tts.
     It scans tts_page_{page}_panel_{idx}.wav and writes the corresponding URL to panels.audio_b64.
     """
-    proj = EditorDB.get_project(project_id)
+    proj = await _db_call(EditorDB.get_project, project_id)
     if not proj:
         raise HTTPException(status_code=404, detail="Project not found")
 
@@ -4518,37 +5390,25 @@ async def api_tts_backfill_urls(project_id: str):
     if not os.path.isdir(tts_dir):
         return {"ok": True, "updated": 0, "found": 0, "message": "No tts directory"}
 
-    import re
-    updated = 0
-    found = 0
-    for name in os.listdir(tts_dir):
-        if not name.lower().endswith('.wav'):
-            continue
-        m = re.match(r"tts_page_(\d+)_panel_(\d+)\.wav$", name)
-        if not m:
-            continue
-        found += 1
-        page_number = int(m.group(1))
-        panel_index = int(m.group(2))
-        url = f"/manga_projects/{project_id}/tts/{name}"
-        try:
-            EditorDB.set_panel_audio(project_id, page_number, panel_index, url)
-            updated += 1
-        except Exception:
-            logger.exception("Backfill failed for %s", name)
-            continue
+    rows = await asyncio.to_thread(_scan_tts_dir, project_id, tts_dir)
+
+    # One transaction for the whole directory instead of a commit per file
+    try:
+        await _db_call(EditorDB.set_panel_audios_bulk, project_id, rows)
+        updated = len(rows)
+    except Exception:
+        logger.exception("Backfill failed for project %s", project_id)
+        updated = 0
 
-    return {"ok": True, "updated": updated, "found": found}
+    return {"ok": True, "updated": updated, "found": len(rows)}
 
 @router.post("/api/upload-chapter-images")
-async def upload_chapter_images(request: Request):
+async def upload_chapter_images(
+    project_id: Optional[str] = Form(None),
+    files: Optional[List[UploadFile]] = File(None),
+):
     """Upload images for a chapter manually"""
     try:
-        from fastapi import UploadFile, File, Form
-        
-        form = await request.form()
-        project_id = form.get("project_id")
-        
         if not project_id:
             return JSONResponse(content={"error": "project_id is required"}, status_code=400)
         
@@ -4557,14 +5417,12 @@ async def upload_chapter_images(request: Request):
         if not project:
             return JSONResponse(content={"error": "Project not found"}, status_code=404)
         
-        # Get uploaded files
-        files = form.getlist("files")
         if not files:
             return JSONResponse(content={"error": "No files uploaded"}, status_code=400)
         
         # Create project directory
         project_dir = os.path.join(MANGA_DIR, project_id)
-        os.makedirs(project_dir, exist_ok=True)
+        _ensure_dir(project_dir)
         
         # Save files
         saved_files = []
@@ -4577,10 +5435,9 @@ async def upload_chapter_images(request: Request):
             filename = f"page_{idx:03d}{ext}"
             file_path = os.path.join(project_dir, filename)
             
-            # Save file
-            content = await file.read()
-            with open(file_path, 'wb') as f:
-                f.write(content)
+            # Save file: stream the spooled upload to disk off the event loop
+            await file.seek(0)
+            await asyncio.to_thread(_copy_to, file.file, file_path)
             
             # Store relative path
             relative_path = f"/manga_projects/{project_id}/{filename}"
@@ -4590,14 +5447,7 @@ async def upload_chapter_images(request: Request):
             return JSONResponse(content={"error": "No valid image files uploaded"}, status_code=400)
         
         # Update project with uploaded images
-        pages_json = [{"page_number": i, "image_path": path} for i, path in enumerate(saved_files, start=1)]
-        
-        conn = EditorDB.conn()
-        conn.execute(
-            "UPDATE project_details SET pages_json=?, has_images=1 WHERE id=?",
-            (json.dumps(pages_json), project_id)
-        )
-        conn.commit()
+        EditorDB.set_project_images(project_id, saved_files)
         
         return JSONResponse(content={
             "success": True,
@@ -4642,8 +5492,7 @@ async def fetch_chapter_images(payload: Dict[str, Any]):
         if mangadex_secret:
             headers["Authorization"] = f"Bearer {mangadex_secret}"
         
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            at_home_response = await client.get(at_home_url, headers=headers)
+        at_home_response = await _get_http_client().get(at_home_url, headers=headers, timeout=10.0)
         
         if at_home_response.status_code != 200:
             raise HTTPException(status_code=404, detail=f"MangaDex chapter not found: {mangadex_chapter_id}")
@@ -4675,11 +5524,6 @@ async def fetch_chapter_images(payload: Dict[str, Any]):
                     
                     logger.info(f"Downloading image {idx}/{len(filenames)}: {filename}")
                     
-                    # Download image
-                    response = requests.get(image_url, timeout=30)
-                    response.raise_for_status()
-                    image_data = response.content
-                    
                     # Determine file extension from original filename
                     ext = os.path.splitext(filename)[1] or '.jpg'
                     
@@ -4687,8 +5531,18 @@ async def fetch_chapter_images(payload: Dict[str, Any]):
                     save_filename = f"page_{idx:03d}{ext}"
                     file_path = os.path.join(project_dir, save_filename)
                     
-                    with open(file_path, 'wb') as f:
-                        f.write(image_data)
+                    # Download image straight to disk over the pooled session
+                    with _HTTP.get(image_url, timeout=30, stream=True) as response:
+                        response.raise_for_status()
+                        try:
+                            with open(file_path, "wb") as out:
+                                for chunk in response.iter_content(chunk_size=1 << 20):
+                                    out.write(chunk)
+                        except BaseException:
+                            # Don't leave a truncated page behind for a failed download
+                            if os.path.exists(file_path):
+                                os.remove(file_path)
+                            raise
                     
                     # Store relative path
                     relative_path = f"/manga_projects/{chapter_id}/{save_filename}"
@@ -4711,14 +5565,7 @@ async def fetch_chapter_images(payload: Dict[str, Any]):
             raise HTTPException(status_code=500, detail="Failed to download any images")
         
         # Update project with fetched images
-        pages_json = [{"page_number": i, "image_path": path} for i, path in enumerate(saved_files, start=1)]
-        
-        conn = EditorDB.conn()
-        conn.execute(
-            "UPDATE project_details SET pages_json=?, has_images=1 WHERE id=?",
-            (json.dumps(pages_json), chapter_id)
-        )
-        conn.commit()
+        EditorDB.set_project_images(chapter_id, saved_files)
         
         logger.info(f"Successfully fetched {len(saved_files)} images for chapter {chapter_id}")
         
@@ -4783,7 +5630,7 @@ async def api_narrate_auto_web(project_id: str, page_number: int, payload: Dict[
     from gemini_automator import GeminiAutomator
 
     # 1. Fetch Panels/Images
-    panels = EditorDB.get_panels_for_page(project_id, page_number)
+    panels = await _db_call(EditorDB.get_panels_for_page, project_id, page_number)
     if not panels:
         raise HTTPException(status_code=404, detail="No panels found for this page")
         
@@ -4868,7 +5715,7 @@ async def api_narrate_auto_web(project_id: str, page_number: int, payload: Dict[
         
         # 5. Save Results
         if new_panels:
-             EditorDB.save_manual_narration(project_id, page_number, new_panels)
+             await _db_call(EditorDB.save_manual_narration, project_id, page_number, new_panels)
              return {"ok": True, "panels": new_panels}
         else:
              raise ValueError("No 'panels' key in response")